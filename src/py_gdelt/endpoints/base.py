@@ -13,9 +13,10 @@ the _build_url() method for their specific URL construction logic.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from tenacity import (
@@ -29,11 +30,31 @@ from py_gdelt.config import GDELTSettings
 from py_gdelt.exceptions import APIError, APIUnavailableError, RateLimitError
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
 __all__ = ["BaseEndpoint"]
 
 logger = logging.getLogger(__name__)
 
 
+def _select_json_loads() -> Callable[[bytes], Any] | None:
+    """Pick orjson's decoder if it is installed.
+
+    Returns:
+        orjson.loads if orjson is installed, otherwise None.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+_json_loads = _select_json_loads()
+
+
 class BaseEndpoint(ABC):
     """Base class for all GDELT REST API endpoints.
 
@@ -241,7 +262,16 @@ class BaseEndpoint(ABC):
             APIError: On other HTTP errors or invalid JSON
         """
         response = await self._get(url, params=params)
-        return response.json()
+        if _json_loads is not None:
+            # orjson rejects some bodies the stdlib accepts (UTF-8 BOM, UTF-16,
+            # lone surrogate escapes, NaN); those fall through to response.json()
+            with contextlib.suppress(ValueError):
+                return _json_loads(response.content)
+        try:
+            return response.json()
+        except ValueError as e:
+            msg = f"Invalid JSON response from {url}"
+            raise APIError(msg) from e
 
     @abstractmethod
     async def _build_url(self, **kwargs: Any) -> str:
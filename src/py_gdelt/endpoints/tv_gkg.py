@@ -186,6 +186,10 @@ class TVGKGEndpoint:
 
         urls = self._build_urls(filter_obj)
 
+        # Normalize filter values once rather than per record
+        station_upper = filter_obj.station.upper() if filter_obj.station else None
+        themes_lower = frozenset(t.lower() for t in filter_obj.themes or ())
+
         async for _url, data in self._file_source.stream_files(urls):
             for raw in self._parser.parse(data):
                 try:
@@ -195,15 +199,11 @@ class TVGKGEndpoint:
                     continue
 
                 # Apply client-side filtering
-                if filter_obj.station:
-                    station_upper = filter_obj.station.upper()
-                    if station_upper not in record.source_identifier.upper():
-                        continue
-
-                if filter_obj.themes:
-                    record_themes_lower = [t.lower() for t in record.themes]
-                    if not any(t.lower() in record_themes_lower for t in filter_obj.themes):
-                        continue
+                if station_upper and station_upper not in record.source_identifier.upper():
+                    continue
+
+                if themes_lower and not any(t.lower() in themes_lower for t in record.themes):
+                    continue
 
                 yield record
 
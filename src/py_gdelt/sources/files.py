@@ -10,11 +10,11 @@ data.gdeltproject.org. It handles:
 """
 
 import asyncio
-import gzip
 import io
 import logging
 import re
 import zipfile
+import zlib
 from collections.abc import AsyncIterator, Iterable
 from datetime import datetime, timedelta
 from typing import Final, Literal, get_args
@@ -43,6 +43,9 @@ LAST_UPDATE_URL: Final[str] = "http://data.gdeltproject.org/gdeltv2/lastupdate.t
 # Decompression limit to prevent gzip bombs
 MAX_DECOMPRESSED_SIZE: Final[int] = 500 * 1024 * 1024  # 500MB limit
 
+# zlib window bits selecting the gzip container format
+GZIP_WBITS: Final[int] = 16 + zlib.MAX_WBITS
+
 # File type patterns
 FILE_TYPE_PATTERNS: Final[dict[str, str]] = {
     "export": ".export.CSV.zip",
@@ -358,7 +361,7 @@ class FileSource:
                 url,
             )
 
-        except (zipfile.BadZipFile, gzip.BadGzipFile) as e:
+        except (zipfile.BadZipFile, zlib.error) as e:
             logger.error("Invalid archive format for %s: %s", url, e)  # noqa: TRY400
             msg = f"Invalid archive format: {e}"
             raise DataError(msg) from e
@@ -481,26 +484,30 @@ class FileSource:
             Decompressed content
 
         Raises:
-            DataError: If decompressed size exceeds limit
+            DataError: If decompressed size exceeds limit or data is truncated
         """
-        result = io.BytesIO()
-        total_size = 0
-
-        with gzip.GzipFile(fileobj=io.BytesIO(compressed_data)) as gz:
-            # Read in chunks to avoid loading huge files into memory
-            chunk_size = 1024 * 1024  # 1MB chunks
-
-            while True:
-                chunk = gz.read(chunk_size)
-                if not chunk:
-                    break
-                total_size += len(chunk)
-                if total_size > MAX_DECOMPRESSED_SIZE:
-                    msg = f"Decompressed size exceeds {MAX_DECOMPRESSED_SIZE // (1024 * 1024)}MB limit"
-                    raise DataError(msg)
-                result.write(chunk)
-
-        return result.getvalue()
+        members: list[bytes] = []
+        remaining = MAX_DECOMPRESSED_SIZE
+        data = compressed_data
+
+        # Decompress each gzip member in one zlib call, capping the output one
+        # byte past the remaining budget so oversized payloads are detected
+        # without decompressing them in full
+        while data:
+            decompressor = zlib.decompressobj(wbits=GZIP_WBITS)
+            member = decompressor.decompress(data, remaining + 1)
+            if len(member) > remaining:
+                msg = f"Decompressed size exceeds {MAX_DECOMPRESSED_SIZE // (1024 * 1024)}MB limit"
+                raise DataError(msg)
+            if not decompressor.eof:
+                msg = "Compressed file ended before the end-of-stream marker was reached"
+                raise DataError(msg)
+            members.append(member)
+            remaining -= len(member)
+            # Concatenated members may be separated by zero padding
+            data = decompressor.unused_data.lstrip(b"\x00")
+
+        return b"".join(members)
 
     @staticmethod
     def _extract_date_from_url(url: str) -> datetime | None:
@@ -47,19 +47,33 @@ def parse_gdelt_datetime(value: str | int | datetime) -> datetime:
     if isinstance(value, int):
         value = str(value)
 
-    # Try ISO format first
+    # 14-digit GDELT timestamp: slice fields directly, strptime is ~3x slower
+    if len(value) == 14 and value.isascii() and value.isdigit():
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[4:6]),
+                int(value[6:8]),
+                int(value[8:10]),
+                int(value[10:12]),
+                int(value[12:14]),
+                tzinfo=UTC,
+            )
+        except ValueError:
+            msg = f"Invalid GDELT date format: {value!r}"
+            raise ValueError(msg) from None
+
+    # Try ISO format next
     try:
         dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
         if dt.tzinfo is None:
             return dt.replace(tzinfo=UTC)
         return dt.astimezone(UTC)
     except ValueError:
-        pass  # Not ISO format, try GDELT formats
+        pass  # Not ISO format, try 8-digit GDELT date
 
-    # GDELT formats: 14-digit timestamp or 8-digit date
+    # GDELT 8-digit date
     try:
-        if len(value) == 14:
-            return datetime.strptime(value, "%Y%m%d%H%M%S").replace(tzinfo=UTC)
         if len(value) == 8:
             return datetime.strptime(value, "%Y%m%d").replace(tzinfo=UTC)
     except ValueError:
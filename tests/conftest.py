@@ -0,0 +1,38 @@
+"""Shared pytest configuration for the test suite.
+
+Integration tests (marked ``integration``) make live network calls and take
+minutes, so they are skipped unless explicitly requested:
+
+    pytest tests/ --run-integration
+"""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --run-integration command line option.
+
+    Args:
+        parser: Pytest command line parser.
+    """
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Run integration tests that make live GDELT API calls",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip integration tests unless --run-integration is given.
+
+    Args:
+        config: Pytest configuration.
+        items: Collected test items.
+    """
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="integration test: use --run-integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
@@ -0,0 +1,25 @@
+"""Schema assertions shared by integration tests.
+
+API results are already parsed into Pydantic models, so checking individual
+attributes with ``hasattr`` only confirms what the model class guarantees.
+Instead, each result is dumped and re-validated against its model in one
+pass, which also enforces field types and constraints and reports every
+violation in a single ValidationError.
+"""
+
+from pydantic import BaseModel
+
+
+def assert_valid(obj: object, model: type[BaseModel]) -> None:
+    """Assert that an API result conforms to its Pydantic model schema.
+
+    Args:
+        obj: Parsed API result.
+        model: Model class the result should conform to.
+
+    Raises:
+        AssertionError: If the result is not an instance of the model.
+        ValidationError: If the result's data no longer satisfies the schema.
+    """
+    assert isinstance(obj, model), f"Expected {model.__name__}, got {type(obj).__name__}"
+    model.model_validate(obj.model_dump(by_alias=True))
@@ -7,26 +7,351 @@ We use pytest-asyncio (not anyio) because:
 - asyncio_mode="auto" in pyproject.toml auto-detects async tests
 - No need for explicit anyio_backend fixture
 
-Run integration tests:
-    pytest tests/integration/ -m integration
+Integration tests share a single session-scoped GDELTClient backed by one
+pooled httpx.AsyncClient, so TCP/TLS connections to the GDELT hosts are
+reused across tests instead of being re-established for every test. The
+tests in this directory run on the session event loop so the pooled
+connections stay bound to a live loop (unit tests keep a loop per test).
+
+REST API tests check once per session that api.gdeltproject.org responds
+(5s timeout) and are all skipped if it does not, instead of each waiting
+for its own timeout.
+
+REST API tests (DOC, GEO, Context, TV) query the live APIs by default. Setting
+GDELT_VCR_RECORD_MODE opts in to VCR cassettes in tests/integration/cassettes/
+(gitignored, local only): "all" records fresh cassettes (make
+integration-record) and "none" replays them offline without the API check
+(make integration-replay). Any other vcrpy record mode is passed through.
+
+Integration modules run cheapest first (see MODULE_ORDER), so ``pytest -x``
+fails fast on the REST APIs before any multi-minute file downloads start.
+
+Under pytest-xdist (``pytest -n auto``) each worker gets its own cache
+directory so concurrent workers never write the same cached file. Use
+``--dist loadscope`` (as ``make integration-parallel`` does) so each module
+runs on a single worker and its module-scoped fixtures (VCR cassette,
+concurrently gathered results) are set up once rather than on every worker.
+
+File-based tests query a single reference date, two days ago by default so
+the files are published. Set GDELT_TEST_DATE (YYYY-MM-DD) to pin it.
+
+Run integration tests (skipped by default, see tests/conftest.py):
+    pytest tests/integration/ -m integration --run-integration
 
 Skip integration tests:
     pytest tests/ -m "not integration"
 """
 
-from collections.abc import AsyncIterator
+import os
+from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing
+from datetime import date, timedelta
+from pathlib import Path
 
+import httpx
 import pytest
+import pytest_asyncio
+import vcr
+from vcr.request import Request
 
 from py_gdelt import GDELTClient
+from py_gdelt.config import GDELTSettings
+from py_gdelt.filters import DateRange, EventFilter, GKGFilter
+from py_gdelt.models import Event, FetchResult, GKGRecord
+
+
+INTEGRATION_DIR = Path(__file__).parent
+
+# Connection pool shared by every integration test. Idle connections are kept
+# for a minute (httpx default: 5s) so they survive slow file-based tests and
+# are still open when the next REST API test runs.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Per-test timeout (seconds) for integration tests without their own timeout mark
+DEFAULT_TIMEOUT = 60
+
+# Single cheap DOC query used to check that the REST APIs are reachable
+HEALTHCHECK_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+HEALTHCHECK_PARAMS = {
+    "query": "test",
+    "mode": "artlist",
+    "maxrecords": "1",
+    "timespan": "24h",
+    "format": "json",
+}
+HEALTHCHECK_TIMEOUT = 5.0
+
+# Number of GKG records streamed once per session for schema checks
+GKG_SAMPLE_SIZE = 50
+
+CASSETTE_DIR = INTEGRATION_DIR / "cassettes"
+
+# Relative windows ("24h", "7d") are ignored when matching so cassettes stay valid
+UNMATCHED_QUERY_PARAMS = frozenset({"timespan"})
+
+
+def _query_without_timespan(r1: Request, r2: Request) -> None:
+    """Match recorded requests on query parameters, ignoring relative time windows.
+
+    Args:
+        r1: Incoming request.
+        r2: Recorded request.
+
+    Raises:
+        AssertionError: If the remaining query parameters differ.
+    """
+    q1 = [(k, v) for k, v in r1.query if k not in UNMATCHED_QUERY_PARAMS]
+    q2 = [(k, v) for k, v in r2.query if k not in UNMATCHED_QUERY_PARAMS]
+    if q1 != q2:
+        msg = f"{q1} != {q2}"
+        raise AssertionError(msg)
+
+
+# Unset means no cassettes: every REST API test hits the live API
+VCR_RECORD_MODE = os.environ.get("GDELT_VCR_RECORD_MODE")
+
+GDELT_VCR = vcr.VCR(
+    cassette_library_dir=str(CASSETTE_DIR),
+    record_mode=VCR_RECORD_MODE or "none",
+    match_on=["method", "scheme", "host", "path", "query_without_timespan"],
+)
+GDELT_VCR.register_matcher("query_without_timespan", _query_without_timespan)
+
+# Integration modules ordered from cheapest to slowest; unlisted modules run last
+MODULE_ORDER = (
+    "test_context_api",
+    "test_doc_api",
+    "test_geo_api",
+    "test_tv_api",
+    "test_bigquery",
+    "test_schema_drift",
+    "test_new_datasets_schema_discovery",
+    "test_events_files",
+)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Apply session event loop and default timeout to integration tests.
+
+    The shared HTTP client is created on the session loop, so tests using it
+    must run there too or its pooled connections would belong to a closed loop.
+
+    Integration tests without their own ``timeout`` mark (function or module
+    level) get DEFAULT_TIMEOUT seconds. Integration items are then stably
+    reordered by MODULE_ORDER within the slots they already occupy, so tests
+    from other directories keep their positions.
+
+    Args:
+        items: Collected test items (all directories, filtered to this one).
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    default_timeout = pytest.mark.timeout(DEFAULT_TIMEOUT)
+    slots: list[int] = []
+    for index, item in enumerate(items):
+        if not item.path.is_relative_to(INTEGRATION_DIR):
+            continue
+        slots.append(index)
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if item.get_closest_marker("integration") and not item.get_closest_marker("timeout"):
+            item.add_marker(default_timeout)
+
+    rank = {name: position for position, name in enumerate(MODULE_ORDER)}
+    ordered = sorted(
+        (items[index] for index in slots),
+        key=lambda item: rank.get(item.path.stem, len(MODULE_ORDER)),
+    )
+    for index, item in zip(slots, ordered, strict=True):
+        items[index] = item
+
+
+@pytest.fixture(scope="session")
+def ref_date() -> date:
+    """Provide the reference date for file-based integration tests.
+
+    Returns:
+        date: GDELT_TEST_DATE if set, otherwise two days ago.
+    """
+    pinned = os.environ.get("GDELT_TEST_DATE")
+    if pinned:
+        return date.fromisoformat(pinned)
+    return date.today() - timedelta(days=2)
+
+
+@pytest.fixture(scope="session")
+def ref_date_range(ref_date: date) -> DateRange:
+    """Provide a single-day date range covering the reference date.
+
+    Args:
+        ref_date: Reference date for file-based tests.
+
+    Returns:
+        DateRange: Range starting and ending on the reference date.
+    """
+    return DateRange(start=ref_date, end=ref_date)
+
+
+@pytest.fixture(scope="session")
+def ref_date_event_filter(ref_date_range: DateRange) -> EventFilter:
+    """Provide an Events filter for the reference date.
 
+    Args:
+        ref_date_range: Single-day range for the reference date.
 
-@pytest.fixture
-async def gdelt_client() -> AsyncIterator[GDELTClient]:
+    Returns:
+        EventFilter: Filter covering the reference date only.
+    """
+    return EventFilter(date_range=ref_date_range)
+
+
+@pytest.fixture(scope="module")
+def vcr_cassette(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Record or replay HTTP traffic for a test module when opted in.
+
+    Use via ``pytestmark = pytest.mark.usefixtures("vcr_cassette")``. Each
+    module gets its own cassette named after the module. Without
+    GDELT_VCR_RECORD_MODE no cassette is used and requests go to the live API.
+
+    Args:
+        request: Pytest fixture request.
+
+    Yields:
+        None: Cassette (if any) is active for the duration of the module.
+    """
+    if VCR_RECORD_MODE is None:
+        yield
+        return
+    module_name = request.module.__name__.rpartition(".")[2]
+    with GDELT_VCR.use_cassette(f"{module_name}.yaml"):
+        yield
+
+
+@pytest.fixture(scope="session")
+def gdelt_settings() -> GDELTSettings:
+    """Provide settings for the integration session.
+
+    Returns:
+        GDELTSettings: Default settings, with a per-worker cache directory
+            when running under pytest-xdist.
+    """
+    settings = GDELTSettings()
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        return settings
+    return GDELTSettings(cache_dir=settings.cache_dir / "xdist" / worker)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Provide a pooled HTTP client shared across the integration session.
+
+    Yields:
+        httpx.AsyncClient: Keep-alive client reused by every integration test.
+    """
+    async with httpx.AsyncClient(
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def gdelt_api_available(http_client: httpx.AsyncClient) -> None:
+    """Skip REST API tests when the GDELT API is unreachable.
+
+    Issues a single small DOC query per session. If it fails, every test
+    using this fixture is skipped immediately. The check is bypassed in
+    replay-only mode (GDELT_VCR_RECORD_MODE=none), where cassettes serve
+    all responses.
+
+    Use via ``pytestmark = pytest.mark.usefixtures("gdelt_api_available")``.
+
+    Args:
+        http_client: Shared pooled HTTP client.
+    """
+    if VCR_RECORD_MODE == "none":
+        return
+    try:
+        response = await http_client.get(
+            HEALTHCHECK_URL,
+            params=HEALTHCHECK_PARAMS,
+            timeout=HEALTHCHECK_TIMEOUT,
+        )
+    except httpx.HTTPError as e:
+        pytest.skip(f"GDELT API unreachable: {e!r}")
+    if response.is_server_error:
+        pytest.skip(f"GDELT API unavailable: HTTP {response.status_code}")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def gdelt_client(
+    gdelt_settings: GDELTSettings,
+    http_client: httpx.AsyncClient,
+) -> AsyncIterator[GDELTClient]:
     """Provide initialized GDELTClient for integration tests.
 
+    The client is created once per session and uses the injected pooled
+    HTTP client, which it does not close on exit.
+
+    Args:
+        gdelt_settings: Session settings.
+        http_client: Shared pooled HTTP client.
+
     Yields:
         GDELTClient: Configured client instance for API calls.
     """
-    async with GDELTClient() as client:
+    async with GDELTClient(settings=gdelt_settings, http_client=http_client) as client:
         yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ref_date_events(
+    gdelt_client: GDELTClient,
+    ref_date_event_filter: EventFilter,
+) -> FetchResult[Event]:
+    """Download and parse the reference date's events once per session.
+
+    Tests that only inspect the parsed events share this result and filter
+    it in memory instead of re-querying the same files.
+
+    Args:
+        gdelt_client: Shared GDELT client.
+        ref_date_event_filter: Events filter for the reference date.
+
+    Returns:
+        FetchResult[Event]: Events for the reference date.
+    """
+    return await gdelt_client.events.query(ref_date_event_filter)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ref_date_gkg_sample(
+    gdelt_client: GDELTClient,
+    ref_date_range: DateRange,
+) -> list[GKGRecord]:
+    """Stream the first GKG records for the reference date once per session.
+
+    Schema and theme checks share this sample instead of each opening its
+    own stream over the same GKG files.
+
+    Args:
+        gdelt_client: Shared GDELT client.
+        ref_date_range: Single-day range for the reference date.
+
+    Returns:
+        list[GKGRecord]: Up to GKG_SAMPLE_SIZE records for the reference date.
+    """
+    records: list[GKGRecord] = []
+    gkg_filter = GKGFilter(date_range=ref_date_range)
+    async with aclosing(gdelt_client.gkg.stream(gkg_filter)) as stream:
+        async for record in stream:
+            records.append(record)
+            if len(records) >= GKG_SAMPLE_SIZE:
+                break
+    return records
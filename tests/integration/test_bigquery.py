@@ -1,7 +1,7 @@
 """Integration tests for BigQuery data source.
 
 These tests make real BigQuery queries against GDELT's public datasets.
-Run with: pytest tests/integration/test_bigquery.py -m integration
+Run with: pytest tests/integration/test_bigquery.py -m integration --run-integration
 
 IMPORTANT: These tests use LIMIT clauses and date filters to minimize costs.
 
@@ -11,9 +11,11 @@ Requirements:
 """
 
 import os
+from collections.abc import AsyncIterator
 from datetime import date, timedelta
 
 import pytest
+import pytest_asyncio
 
 from py_gdelt.filters import DateRange, EventFilter, GKGFilter
 from py_gdelt.sources.bigquery import BigQuerySource
@@ -22,7 +24,6 @@ from py_gdelt.sources.bigquery import BigQuerySource
 # Skip all tests if BigQuery project not configured
 pytestmark = [
     pytest.mark.integration,
-    pytest.mark.asyncio,
     pytest.mark.timeout(60),
     pytest.mark.skipif(
         not os.environ.get("GDELT_BIGQUERY_PROJECT"),
@@ -31,9 +32,16 @@ pytestmark = [
 ]
 
 
-@pytest.fixture
-async def bigquery_source() -> BigQuerySource:
-    """Create BigQuery source for testing."""
+@pytest_asyncio.fixture(scope="module")
+async def bigquery_source() -> AsyncIterator[BigQuerySource]:
+    """Create BigQuery source shared by all tests in this module.
+
+    The BigQuery client (and its credential loading) is created lazily on
+    the first query, so sharing the source authenticates once per module.
+
+    Yields:
+        BigQuerySource: Source instance for BigQuery queries.
+    """
     async with BigQuerySource() as source:
         yield source
 
@@ -73,9 +81,8 @@ async def test_bigquery_query_events_with_country_filter(
     rows = [row async for row in bigquery_source.query_events(event_filter, limit=5)]
 
     # Verify country filter was applied
-    if rows:
-        for row in rows:
-            assert row.get("Actor1CountryCode") == "USA", "Country filter should work"
+    other_countries = {row.get("Actor1CountryCode") for row in rows} - {"USA"}
+    assert not other_countries, f"Country filter should work, got {other_countries}"
 
 
 async def test_bigquery_query_events_select_columns(
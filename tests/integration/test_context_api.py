@@ -1,45 +1,78 @@
-"""Integration tests for Context 2.0 API."""
+"""Integration tests for Context 2.0 API.
+
+All queries are independent, so they are issued concurrently once per module
+by the ``context_results`` fixture; the tests only assert on the results.
+"""
+
+import asyncio
+from dataclasses import dataclass
 
 import pytest
+import pytest_asyncio
 
 from py_gdelt import GDELTClient
+from py_gdelt.endpoints.context import ContextEntity, ContextResult, ContextTheme, ContextTone
+from tests.integration._schemas import assert_valid
 
 
 # Skip all tests - GDELT Context API only supports 'artlist' mode which returns articles,
 # but the library's ContextEndpoint.analyze() expects themes/entities/tone data.
 # This requires a library redesign to match what GDELT actually offers.
-pytestmark = pytest.mark.skip(
-    reason="Library design issue: Context API expects themes/entities/tone but GDELT only returns articles"
-)
+pytestmark = [
+    pytest.mark.skip(
+        reason="Library design issue: Context API expects themes/entities/tone but GDELT only returns articles"
+    ),
+    pytest.mark.usefixtures("gdelt_api_available", "vcr_cassette"),
+]
+
+
+@dataclass(frozen=True, slots=True)
+class ContextResults:
+    """Results of the Context API queries shared by this module's tests."""
+
+    technology: ContextResult
+    climate_themes: list[ContextTheme]
+    economy_entities: list[ContextEntity]
+    election_people: list[ContextEntity]
+    healthcare: ContextResult
+    artificial_intelligence: ContextResult
+
+
+@pytest_asyncio.fixture(scope="module")
+async def context_results(gdelt_client: GDELTClient) -> ContextResults:
+    """Run all Context API queries for this module concurrently.
+
+    Args:
+        gdelt_client: Shared GDELT client.
+
+    Returns:
+        ContextResults: Results keyed by the query each test asserts on.
+    """
+    context = gdelt_client.context
+    results = await asyncio.gather(
+        context.analyze("technology", timespan="7d"),
+        context.get_themes("climate change", limit=5),
+        context.get_entities("economy", limit=10),
+        context.get_entities("election", entity_type="PERSON", timespan="7d", limit=5),
+        context.analyze("healthcare", timespan="7d"),
+        context.analyze("artificial intelligence", timespan="24h"),
+    )
+    return ContextResults(*results)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_context_analyze_returns_result(gdelt_client: GDELTClient) -> None:
+async def test_context_analyze_returns_result(context_results: ContextResults) -> None:
     """Test contextual analysis returns structured result."""
-    result = await gdelt_client.context.analyze(
-        "technology",
-        timespan="7d",
-    )
+    result = context_results.technology
 
-    assert hasattr(result, "query")
+    assert_valid(result, ContextResult)
     assert result.query == "technology"
-    assert hasattr(result, "themes")
-    assert hasattr(result, "entities")
-    assert isinstance(result.themes, list)
-    assert isinstance(result.entities, list)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_context_get_themes(gdelt_client: GDELTClient) -> None:
+async def test_context_get_themes(context_results: ContextResults) -> None:
     """Test getting themes for a topic."""
-    themes = await gdelt_client.context.get_themes(
-        "climate change",
-        limit=5,
-    )
+    themes = context_results.climate_themes
 
     assert isinstance(themes, list)
     assert len(themes) <= 5
@@ -48,20 +81,14 @@ async def test_context_get_themes(gdelt_client: GDELTClient) -> None:
         pytest.skip("No themes returned - API may be temporarily unavailable")
 
     theme = themes[0]
-    assert hasattr(theme, "theme"), "Theme should have theme attribute"
-    assert hasattr(theme, "count"), "Theme should have count attribute"
+    assert_valid(theme, ContextTheme)
     assert theme.count > 0, f"Expected positive count, got {theme.count}"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_context_get_entities(gdelt_client: GDELTClient) -> None:
+async def test_context_get_entities(context_results: ContextResults) -> None:
     """Test getting entities for a topic."""
-    entities = await gdelt_client.context.get_entities(
-        "economy",
-        limit=10,
-    )
+    entities = context_results.economy_entities
 
     assert isinstance(entities, list)
     assert len(entities) <= 10
@@ -70,23 +97,14 @@ async def test_context_get_entities(gdelt_client: GDELTClient) -> None:
         pytest.skip("No entities returned - API may be temporarily unavailable")
 
     entity = entities[0]
-    assert hasattr(entity, "name"), "Entity should have name"
-    assert hasattr(entity, "entity_type"), "Entity should have entity_type"
-    assert hasattr(entity, "count"), "Entity should have count"
+    assert_valid(entity, ContextEntity)
     assert entity.count > 0, f"Expected positive count, got {entity.count}"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_context_get_entities_by_type(gdelt_client: GDELTClient) -> None:
+async def test_context_get_entities_by_type(context_results: ContextResults) -> None:
     """Test filtering entities by type."""
-    people = await gdelt_client.context.get_entities(
-        "election",
-        entity_type="PERSON",
-        timespan="7d",
-        limit=5,
-    )
+    people = context_results.election_people
 
     assert isinstance(people, list)
 
@@ -94,42 +112,27 @@ async def test_context_get_entities_by_type(gdelt_client: GDELTClient) -> None:
         pytest.skip("No people entities returned")
 
     # Verify entity type filtering works
-    for person in people:
-        assert person.entity_type == "PERSON", f"Expected PERSON, got {person.entity_type}"
+    other_types = {person.entity_type for person in people} - {"PERSON"}
+    assert not other_types, f"Expected only PERSON, got {other_types}"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_context_tone_analysis(gdelt_client: GDELTClient) -> None:
+async def test_context_tone_analysis(context_results: ContextResults) -> None:
     """Test tone analysis in context results."""
-    result = await gdelt_client.context.analyze(
-        "healthcare",
-        timespan="7d",
-    )
+    result = context_results.healthcare
 
     if not result.tone:
         pytest.skip("No tone data returned")
 
-    assert hasattr(result.tone, "average_tone"), "Tone should have average_tone"
-    assert hasattr(result.tone, "positive_count"), "Tone should have positive_count"
-    assert hasattr(result.tone, "negative_count"), "Tone should have negative_count"
-    assert hasattr(result.tone, "neutral_count"), "Tone should have neutral_count"
-    # Average tone should be a float
-    assert isinstance(result.tone.average_tone, (int, float)), "average_tone should be numeric"
+    # Validates average_tone is numeric and the counts are ints
+    assert_valid(result.tone, ContextTone)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_context_article_count(gdelt_client: GDELTClient) -> None:
+async def test_context_article_count(context_results: ContextResults) -> None:
     """Test that article count is returned."""
-    result = await gdelt_client.context.analyze(
-        "artificial intelligence",
-        timespan="24h",
-    )
+    result = context_results.artificial_intelligence
 
-    assert hasattr(result, "article_count"), "Result should have article_count"
     assert isinstance(result.article_count, int), "article_count should be int"
 
     if result.article_count == 0:
@@ -1,63 +1,69 @@
 """Integration tests for DOC 2.0 API.
 
 These tests make real API calls and verify response structure.
-Run with: pytest tests/integration/ -m integration
+Run with: pytest tests/integration/ -m integration --run-integration
 """
 
+from typing import Any
+
 import pytest
 
 from py_gdelt import GDELTClient
 from py_gdelt.filters import DocFilter
+from py_gdelt.models import Article
+from tests.integration._schemas import assert_valid
+
+
+# Skip fast if the API is down; opt-in cassette via GDELT_VCR_RECORD_MODE
+pytestmark = pytest.mark.usefixtures("gdelt_api_available", "vcr_cassette")
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_doc_search_returns_articles(gdelt_client: GDELTClient) -> None:
-    """Test that DOC search returns articles with expected structure."""
-    doc_filter = DocFilter(
-        query="technology",
-        timespan="24h",  # Relative, not hardcoded date
-        max_results=10,
-    )
+@pytest.mark.parametrize(
+    "filter_kwargs",
+    [
+        pytest.param(
+            {"query": "technology", "timespan": "24h", "max_results": 10},
+            id="basic",
+        ),
+        pytest.param(
+            {"query": "climate", "timespan": "7d", "source_language": "english", "max_results": 5},
+            id="language",
+        ),
+        pytest.param(
+            {"query": "economy", "timespan": "24h", "mode": "artlist", "max_results": 5},
+            id="mode",
+        ),
+        # Domain is a hint to the API, not a strict filter
+        pytest.param(
+            {"query": "technology", "timespan": "7d", "domain": "bbc.com", "max_results": 5},
+            id="domain",
+        ),
+    ],
+)
+async def test_doc_search_variants(
+    gdelt_client: GDELTClient,
+    filter_kwargs: dict[str, Any],
+) -> None:
+    """Test that DOC search variants return articles with expected structure."""
+    doc_filter = DocFilter(**filter_kwargs)
 
     articles = await gdelt_client.doc.query(doc_filter)
 
     # Assert we got results (don't assert exact count)
     assert isinstance(articles, list)
+    assert len(articles) <= filter_kwargs["max_results"]
 
     if not articles:
         pytest.skip("No articles returned - API may be temporarily unavailable")
 
     # Verify structure
     article = articles[0]
-    assert hasattr(article, "title"), "Article should have title"
-    assert hasattr(article, "url"), "Article should have url"
-    assert hasattr(article, "domain"), "Article should have domain"
+    assert_valid(article, Article)
     assert article.url.startswith("http"), f"URL should start with http, got {article.url}"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_doc_search_with_language_filter(gdelt_client: GDELTClient) -> None:
-    """Test language filtering works."""
-    doc_filter = DocFilter(
-        query="climate",
-        timespan="7d",
-        source_language="english",
-        max_results=5,
-    )
-
-    articles = await gdelt_client.doc.query(doc_filter)
-
-    # Just verify it doesn't error - content filtering is best-effort
-    assert isinstance(articles, list)
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_doc_timeline(gdelt_client: GDELTClient) -> None:
     """Test timeline endpoint returns data points."""
     timeline = await gdelt_client.doc.timeline(
@@ -68,46 +74,3 @@ async def test_doc_timeline(gdelt_client: GDELTClient) -> None:
     # Verify structure
     assert hasattr(timeline, "points")
     assert isinstance(timeline.points, list)
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_doc_search_with_mode(gdelt_client: GDELTClient) -> None:
-    """Test search mode parameter."""
-    doc_filter = DocFilter(
-        query="economy",
-        timespan="24h",
-        mode="artlist",
-        max_results=5,
-    )
-
-    articles = await gdelt_client.doc.query(doc_filter)
-
-    assert isinstance(articles, list)
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_doc_search_with_domain_filter(gdelt_client: GDELTClient) -> None:
-    """Test domain filtering."""
-    doc_filter = DocFilter(
-        query="technology",
-        timespan="7d",
-        domain="bbc.com",
-        max_results=5,
-    )
-
-    articles = await gdelt_client.doc.query(doc_filter)
-
-    # Verify structure (may return empty if no BBC articles)
-    assert isinstance(articles, list)
-
-    if not articles:
-        pytest.skip("No articles returned for domain filter test")
-
-    # Verify domain filtering works (note: domain is a hint, not strict filter)
-    bbc_articles = [a for a in articles if "bbc" in a.url.lower()]
-    # At least some should be from BBC if domain filtering works
-    assert len(bbc_articles) > 0 or len(articles) > 0, "Expected some articles"
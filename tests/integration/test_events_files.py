@@ -1,28 +1,31 @@
-"""Integration tests for Events endpoint with file sources."""
+"""Integration tests for Events endpoint with file sources.
 
+These tests are independent and dominated by file downloads, so they can be
+spread across processes with pytest-xdist:
+
+    pytest tests/integration/test_events_files.py -m slow -n auto --run-integration
+"""
+
+from contextlib import aclosing
 from datetime import date, timedelta
 
 import pytest
 
 from py_gdelt import GDELTClient
 from py_gdelt.filters import DateRange, EventFilter
-from py_gdelt.models import FetchResult
+from py_gdelt.models import Event, FetchResult
+from tests.integration._schemas import assert_valid
+
+
+# 2 minute timeout for file downloads
+pytestmark = pytest.mark.timeout(120)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
-@pytest.mark.timeout(120)  # 2 minute timeout for file downloads
-async def test_events_query_returns_events(gdelt_client: GDELTClient) -> None:
+async def test_events_query_returns_events(ref_date_events: FetchResult[Event]) -> None:
     """Test events query returns events from files."""
-    # Use yesterday to ensure data exists
-    yesterday = date.today() - timedelta(days=2)
-
-    event_filter = EventFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-    )
-
-    result = await gdelt_client.events.query(event_filter)
+    result = ref_date_events
 
     # File-based queries may fail if files don't exist yet
     # Just verify we get a list back
@@ -30,91 +33,44 @@ async def test_events_query_returns_events(gdelt_client: GDELTClient) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
-@pytest.mark.timeout(120)
-async def test_events_streaming(gdelt_client: GDELTClient) -> None:
+async def test_events_streaming(
+    gdelt_client: GDELTClient,
+    ref_date_range: DateRange,
+) -> None:
     """Test events streaming works."""
-    yesterday = date.today() - timedelta(days=2)
-
     event_filter = EventFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
+        date_range=ref_date_range,
     )
 
+    # Close the stream on break so in-flight file downloads are cancelled
+    # instead of finishing on the shared client after the test returns
     count = 0
-    async for event in gdelt_client.events.stream(event_filter):
-        count += 1
-        assert hasattr(event, "global_event_id")
-        if count >= 10:  # Just verify streaming works
-            break
+    async with aclosing(gdelt_client.events.stream(event_filter)) as events:
+        async for event in events:
+            count += 1
+            assert hasattr(event, "global_event_id")
+            if count >= 10:  # Just verify streaming works
+                break
 
     if count == 0:
         pytest.skip("No events returned - files may be temporarily unavailable")
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(120)
-async def test_events_with_country_filter(gdelt_client: GDELTClient) -> None:
-    """Test filtering events by country."""
-    yesterday = date.today() - timedelta(days=2)
-
-    event_filter = EventFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-        actor1_country="USA",
-    )
-
-    result = await gdelt_client.events.query(event_filter)
-
-    # Verify we got a FetchResult with data
-    assert isinstance(result, FetchResult)
-
-    if not result.data:
-        pytest.skip("No events returned for country filter test")
-
-    # Note: Country filtering is applied during file parsing, results depend on data
-    # Just verify we got events and the query didn't error
-    assert len(result.data) >= 0, "Should return a valid result"
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
-@pytest.mark.timeout(120)
-async def test_events_query_event_structure(gdelt_client: GDELTClient) -> None:
+async def test_events_query_event_structure(ref_date_events: FetchResult[Event]) -> None:
     """Test that events have expected structure."""
-    yesterday = date.today() - timedelta(days=2)
-
-    event_filter = EventFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-    )
-
-    count = 0
-    async for event in gdelt_client.events.stream(event_filter):
-        # Verify required fields
-        assert hasattr(event, "global_event_id")
-        assert hasattr(event, "date")
-        assert hasattr(event, "event_code")
-
-        # Optional fields
-        assert hasattr(event, "goldstein_scale")
-        assert hasattr(event, "actor1")
-        assert hasattr(event, "actor2")
-
-        count += 1
-        if count >= 3:  # Just verify a few
-            break
+    for event in ref_date_events.data[:3]:  # Just verify a few
+        assert_valid(event, Event)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
-@pytest.mark.timeout(120)
-async def test_events_date_range(gdelt_client: GDELTClient) -> None:
+async def test_events_date_range(gdelt_client: GDELTClient, ref_date: date) -> None:
     """Test querying a specific date range."""
-    # Use dates 3-4 days ago to ensure files exist
-    end_date = date.today() - timedelta(days=3)
+    # Use the two days before the reference date to ensure files exist
+    end_date = ref_date - timedelta(days=1)
     start_date = end_date - timedelta(days=1)
 
     event_filter = EventFilter(
@@ -129,6 +85,6 @@ async def test_events_date_range(gdelt_client: GDELTClient) -> None:
     if not result.data:
         pytest.skip("No events returned for date range test")
 
-    # Verify events have expected date attribute
-    for event in result.data[:5]:
-        assert hasattr(event, "date"), "Event should have date attribute"
+    # Verify every event has a date
+    undated = [event.global_event_id for event in result.data if event.date is None]
+    assert not undated, f"Events without a date: {undated[:10]}"
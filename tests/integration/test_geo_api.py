@@ -3,11 +3,15 @@
 import pytest
 
 from py_gdelt import GDELTClient
+from py_gdelt.endpoints.geo import GeoPoint
+from tests.integration._schemas import assert_valid
+
+
+# Skip fast if the API is down; opt-in cassette via GDELT_VCR_RECORD_MODE
+pytestmark = pytest.mark.usefixtures("gdelt_api_available", "vcr_cassette")
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_geo_search_returns_points(gdelt_client: GDELTClient) -> None:
     """Test that GEO search returns geographic points."""
     result = await gdelt_client.geo.search(
@@ -23,15 +27,12 @@ async def test_geo_search_returns_points(gdelt_client: GDELTClient) -> None:
         pytest.skip("No points returned - API may be temporarily unavailable")
 
     point = result.points[0]
-    assert hasattr(point, "lat"), "Point should have lat"
-    assert hasattr(point, "lon"), "Point should have lon"
+    assert_valid(point, GeoPoint)
     assert -90 <= point.lat <= 90, f"Latitude {point.lat} out of range"
     assert -180 <= point.lon <= 180, f"Longitude {point.lon} out of range"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_geo_geojson_format(gdelt_client: GDELTClient) -> None:
     """Test GeoJSON output format."""
     geojson = await gdelt_client.geo.to_geojson(
@@ -50,8 +51,6 @@ async def test_geo_geojson_format(gdelt_client: GDELTClient) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_geo_search_with_max_points(gdelt_client: GDELTClient) -> None:
     """Test max_points parameter."""
     max_points = 10
@@ -67,8 +66,6 @@ async def test_geo_search_with_max_points(gdelt_client: GDELTClient) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_geo_point_attributes(gdelt_client: GDELTClient) -> None:
     """Test that geographic points have expected attributes."""
     result = await gdelt_client.geo.search(
@@ -81,11 +78,7 @@ async def test_geo_point_attributes(gdelt_client: GDELTClient) -> None:
         pytest.skip("No points returned for attribute test")
 
     point = result.points[0]
-    # Verify required attributes
-    assert hasattr(point, "lat"), "Point should have lat"
-    assert hasattr(point, "lon"), "Point should have lon"
-    assert hasattr(point, "count"), "Point should have count"
-    # Name may be None for some points
-    assert hasattr(point, "name"), "Point should have name attribute"
+    # Validates lat/lon/count and the optional name in one pass
+    assert_valid(point, GeoPoint)
     # Count should be positive
     assert point.count > 0, f"Expected positive count, got {point.count}"
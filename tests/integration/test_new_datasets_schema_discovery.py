@@ -8,15 +8,19 @@ of 4 new datasets that need to be integrated:
 4. Radio NGrams
 
 The tests print column counts and sample data to stdout for schema discovery.
+The four samples are independent, so the module-scoped ``dataset_samples``
+fixture downloads them concurrently and each test prints its own.
 
 Usage:
     Run all schema discovery tests:
         make integration-new-datasets
 
     Run a specific dataset test:
-        uv run pytest tests/integration/test_new_datasets_schema_discovery.py::test_vgkg_schema_discovery -v -s
+        uv run pytest tests/integration/test_new_datasets_schema_discovery.py::test_vgkg_schema_discovery -v -s --run-integration
 
 Note:
+    - All tests share the session-scoped pooled HTTP client from conftest.py,
+      so connections to data.gdeltproject.org are reused across tests
     - These tests require network access to data.gdeltproject.org
     - Tests will skip if files are not found (404 errors)
     - Use -s flag to see printed output (sample data)
@@ -24,13 +28,16 @@ Note:
 
 from __future__ import annotations
 
-import gzip
+import asyncio
 import io
+import itertools
 import logging
+import zlib
 from typing import Final
 
 import httpx
 import pytest
+import pytest_asyncio
 
 
 logger = logging.getLogger(__name__)
@@ -43,29 +50,42 @@ TV_GKG_LAST_UPDATE_URL: Final[str] = (
 TV_NGRAMS_INVENTORY_URL: Final[str] = "http://data.gdeltproject.org/gdeltv3/iatv/ngramsv2/"
 RADIO_NGRAMS_INVENTORY_URL: Final[str] = "http://data.gdeltproject.org/gdeltv3/iaradio/ngrams/"
 
+# Per-request timeout for file downloads on the shared session client
+DOWNLOAD_TIMEOUT: Final[float] = 60.0
 
-def _extract_gzip(compressed_data: bytes) -> bytes:
-    """Extract GZIP file content.
+# zlib window bits selecting the gzip container format
+GZIP_WBITS: Final[int] = 16 + zlib.MAX_WBITS
+
+
+async def _download_head(client: httpx.AsyncClient, url: str, *, min_lines: int) -> bytes:
+    """Download a file only until its first lines have been decompressed.
+
+    The response is streamed and ``.gz`` files are decompressed
+    incrementally, so the download stops as soon as ``min_lines`` complete
+    lines are available instead of buffering the whole file.
 
     Args:
-        compressed_data: GZIP compressed bytes
+        client: Shared HTTP client
+        url: URL of the file to sample
+        min_lines: Number of complete lines needed
 
     Returns:
-        Decompressed content
+        Decompressed content from the start of the file
     """
-    result = io.BytesIO()
-
-    with gzip.GzipFile(fileobj=io.BytesIO(compressed_data)) as gz:
-        # Read in chunks to avoid memory issues
-        chunk_size = 1024 * 1024  # 1MB chunks
-
-        while True:
-            chunk = gz.read(chunk_size)
-            if not chunk:
+    decompressor = zlib.decompressobj(wbits=GZIP_WBITS) if url.endswith(".gz") else None
+    content = bytearray()
+    newlines = 0
+
+    async with client.stream("GET", url, timeout=DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            data = decompressor.decompress(chunk) if decompressor else chunk
+            content += data
+            newlines += data.count(b"\n")
+            if newlines >= min_lines:
                 break
-            result.write(chunk)
 
-    return result.getvalue()
+    return bytes(content)
 
 
 def _print_sample_data(
@@ -79,251 +99,304 @@ def _print_sample_data(
     Args:
         dataset_name: Name of the dataset (for display)
         file_url: URL of the file (for display)
-        content: Decompressed file content
+        content: Decompressed content from the start of the file
         max_rows: Maximum number of rows to print
     """
-    lines = content.decode("utf-8", errors="ignore").split("\n")
-    non_empty_lines = [line for line in lines if line.strip()]
+    # Read lines lazily and stop after max_rows instead of splitting everything
+    text = io.TextIOWrapper(io.BytesIO(content), encoding="utf-8", errors="ignore", newline="\n")
+    non_empty_lines = (line.rstrip("\n") for line in text if line.strip())
 
     print(f"\n{'=' * 80}")
     print(f"Dataset: {dataset_name}")
     print(f"File URL: {file_url}")
-    print(f"Total lines (non-empty): {len(non_empty_lines)}")
     print(f"{'=' * 80}\n")
 
-    for idx, line in enumerate(non_empty_lines[:max_rows], start=1):
+    for idx, line in enumerate(itertools.islice(non_empty_lines, max_rows), start=1):
         columns = line.split("\t")
         print(f"Row {idx}: {len(columns)} columns")
         print("-" * 80)
 
         # Print each column with its index and value (truncate long values)
+        parts = []
         for col_idx, col_value in enumerate(columns):
             # Truncate very long values for readability
-            display_value = col_value[:100] if len(col_value) > 100 else col_value
-            if len(col_value) > 100:
-                display_value += f"... (truncated, total: {len(col_value)} chars)"
+            display_value = col_value
+            if (value_len := len(col_value)) > 100:
+                display_value = f"{col_value[:100]}... (truncated, total: {value_len} chars)"
 
-            print(f"  [{col_idx:3d}] {display_value}")
+            parts.append(f"  [{col_idx:3d}] {display_value}")
 
-        print()
+        # One write per row instead of one per column
+        print("\n".join(parts), end="\n\n")
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(180)  # 3 minute timeout for downloads
-async def test_vgkg_schema_discovery() -> None:
-    """Discover schema for VGKG v2 (Visual Global Knowledge Graph) dataset.
+async def _sample_vgkg(http_client: httpx.AsyncClient) -> tuple[str, bytes]:
+    """Download the first 3 rows of a recent VGKG v2 file.
 
-    Downloads a recent VGKG file and prints sample data to understand the schema.
-    """
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # Get the last update file to find a recent data file
-        try:
-            response = await client.get(VGKG_LAST_UPDATE_URL)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"VGKG lastupdate.txt not found: {VGKG_LAST_UPDATE_URL}")
-            raise
-
-        # Parse the lastupdate.txt file (format: file_size hash file_url)
-        lastupdate_content = response.text.strip()
-        lines = lastupdate_content.split("\n")
-
-        # Find the first VGKG data file URL (URL is in the 3rd column)
-        vgkg_url = None
-        for line in lines:
-            parts = line.split()
-            if len(parts) >= 3 and "vgkg" in parts[2].lower():
-                vgkg_url = parts[2]
-                break
+    Args:
+        http_client: Shared HTTP client
 
-        if vgkg_url is None:
-            pytest.skip("No VGKG file URL found in lastupdate.txt")
+    Returns:
+        Tuple of (file_url, content) for the sampled file
+    """
+    # Get the last update file to find a recent data file
+    try:
+        response = await http_client.get(VGKG_LAST_UPDATE_URL, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"VGKG lastupdate.txt not found: {VGKG_LAST_UPDATE_URL}")
+        raise
+
+    # Parse the lastupdate.txt file (format: file_size hash file_url)
+    lastupdate_content = response.text.strip()
+    lines = lastupdate_content.split("\n")
+
+    # Find the first VGKG data file URL (URL is in the 3rd column)
+    vgkg_url = None
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 3 and "vgkg" in parts[2].lower():
+            vgkg_url = parts[2]
+            break
+
+    if vgkg_url is None:
+        pytest.skip("No VGKG file URL found in lastupdate.txt")
+
+    # Download just the start of the file
+    try:
+        logger.info("Downloading VGKG file: %s", vgkg_url)
+        content = await _download_head(http_client, vgkg_url, min_lines=3)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"VGKG file not found: {vgkg_url}")
+        raise
+
+    return vgkg_url, content
+
+
+async def _sample_tv_gkg(http_client: httpx.AsyncClient) -> tuple[str, bytes]:
+    """Download the first 3 rows of a recent TV-GKG file.
 
-        # Download the file
-        try:
-            logger.info("Downloading VGKG file: %s", vgkg_url)
-            response = await client.get(vgkg_url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"VGKG file not found: {vgkg_url}")
-            raise
+    Args:
+        http_client: Shared HTTP client
 
-        # Decompress if gzipped
-        content = response.content
-        if vgkg_url.endswith(".gz"):
-            content = _extract_gzip(content)
+    Returns:
+        Tuple of (file_url, content) for the sampled file
+    """
+    # Get the last update file to find a recent data file
+    try:
+        response = await http_client.get(TV_GKG_LAST_UPDATE_URL, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"TV-GKG lastupdate.txt not found: {TV_GKG_LAST_UPDATE_URL}")
+        raise
+
+    # Parse the lastupdate.txt file (format: file_size hash file_url)
+    lastupdate_content = response.text.strip()
+    lines = lastupdate_content.split("\n")
+
+    # Find a GKG file URL (URL is in the 3rd column)
+    tv_gkg_url = None
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 3 and ".gkg." in parts[2].lower():
+            tv_gkg_url = parts[2]
+            break
+
+    if tv_gkg_url is None:
+        pytest.skip("No TV-GKG file URL found in lastupdate.txt")
+
+    # Download just the start of the file
+    try:
+        logger.info("Downloading TV-GKG file: %s", tv_gkg_url)
+        content = await _download_head(http_client, tv_gkg_url, min_lines=3)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"TV-GKG file not found: {tv_gkg_url}")
+        raise
+
+    return tv_gkg_url, content
+
+
+async def _sample_tv_ngrams(http_client: httpx.AsyncClient) -> tuple[str, bytes]:
+    """Download the first 5 rows of a recent TV NGrams 1gram file.
 
-        # Print sample data
-        _print_sample_data("VGKG v2", vgkg_url, content, max_rows=3)
+    Args:
+        http_client: Shared HTTP client
 
+    Returns:
+        Tuple of (file_url, content) for the sampled file
+    """
+    # TV NGrams uses station-specific file lists
+    # Try CNN as it's a common station
+    filelist_url = "http://data.gdeltproject.org/gdeltv3/iatv/ngrams/FILELIST-CNN.TXT"
+
+    try:
+        response = await http_client.get(filelist_url, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"TV NGrams filelist not found: {filelist_url}")
+        raise
+
+    # Parse the file list (one URL per line), splitting off only the last
+    # 20 entries (most recent) instead of every line in the list
+    filelist_content = response.text.strip()
+    recent_lines = filelist_content.rsplit("\n", 20)[-20:]
+
+    # Find a recent 1gram file
+    tv_ngrams_url = None
+    for line in reversed(recent_lines):
+        if "1gram" in line and line.strip().endswith(".gz"):
+            tv_ngrams_url = line.strip()
+            break
+
+    if not tv_ngrams_url:
+        pytest.skip("No TV NGrams 1gram file found in filelist")
+
+    # Type narrowing: after skip, tv_ngrams_url is str
+    assert tv_ngrams_url is not None
+
+    # Download just the start of the file
+    try:
+        logger.info("Downloading TV NGrams file: %s", tv_ngrams_url)
+        content = await _download_head(http_client, tv_ngrams_url, min_lines=5)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"TV NGrams file not found: {tv_ngrams_url}")
+        raise
+
+    return tv_ngrams_url, content
+
+
+async def _sample_radio_ngrams(http_client: httpx.AsyncClient) -> tuple[str, bytes]:
+    """Download the first 5 rows of a Radio NGrams 1gram file.
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(180)
-async def test_tv_gkg_schema_discovery() -> None:
-    """Discover schema for TV-GKG (Television Global Knowledge Graph) dataset.
+    Args:
+        http_client: Shared HTTP client
 
-    Downloads a recent TV-GKG file and prints sample data to understand the schema.
+    Returns:
+        Tuple of (file_url, content) for the sampled file
     """
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # Get the last update file to find a recent data file
-        try:
-            response = await client.get(TV_GKG_LAST_UPDATE_URL)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"TV-GKG lastupdate.txt not found: {TV_GKG_LAST_UPDATE_URL}")
-            raise
-
-        # Parse the lastupdate.txt file (format: file_size hash file_url)
-        lastupdate_content = response.text.strip()
-        lines = lastupdate_content.split("\n")
-
-        # Find a GKG file URL (URL is in the 3rd column)
-        tv_gkg_url = None
-        for line in lines:
-            parts = line.split()
-            if len(parts) >= 3 and ".gkg." in parts[2].lower():
-                tv_gkg_url = parts[2]
-                break
+    # The Radio NGrams directory has daily YYYYMMDD.txt inventory files
+    # Use a known working date (2023) since recent data may not be available
+    inventory_url = f"{RADIO_NGRAMS_INVENTORY_URL}20230101.txt"
 
-        if tv_gkg_url is None:
-            pytest.skip("No TV-GKG file URL found in lastupdate.txt")
+    try:
+        response = await http_client.get(inventory_url, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"Radio NGrams inventory not found: {inventory_url}")
+        raise
 
-        # Download the file
-        try:
-            logger.info("Downloading TV-GKG file: %s", tv_gkg_url)
-            response = await client.get(tv_gkg_url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"TV-GKG file not found: {tv_gkg_url}")
-            raise
+    # Parse inventory file (one URL per line)
+    inventory_content = response.text.strip()
+    lines = inventory_content.split("\n")
 
-        # Decompress if gzipped
-        content = response.content
-        if tv_gkg_url.endswith(".gz"):
-            content = _extract_gzip(content)
+    # Find a 1gram file
+    radio_ngrams_url = None
+    for raw_line in lines:
+        line = raw_line.strip()
+        if "1gram" in line and line.endswith(".gz"):
+            radio_ngrams_url = line
+            break
 
-        # Print sample data
-        _print_sample_data("TV-GKG", tv_gkg_url, content, max_rows=3)
+    if not radio_ngrams_url:
+        pytest.skip("No Radio NGrams 1gram file found in inventory")
 
+    # Type narrowing
+    assert radio_ngrams_url is not None
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(180)
-async def test_tv_ngrams_schema_discovery() -> None:
-    """Discover schema for TV NGrams dataset.
+    # Download just the start of the file
+    try:
+        logger.info("Downloading Radio NGrams file: %s", radio_ngrams_url)
+        content = await _download_head(http_client, radio_ngrams_url, min_lines=5)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            pytest.skip(f"Radio NGrams file not found: {radio_ngrams_url}")
+        raise
+
+    return radio_ngrams_url, content
+
+
+# Sampled (file_url, content), or the skip/error raised while downloading it
+DatasetSample = tuple[str, bytes] | BaseException
+
+
+@pytest_asyncio.fixture(scope="module")
+async def dataset_samples(http_client: httpx.AsyncClient) -> dict[str, DatasetSample]:
+    """Download samples of all four datasets concurrently.
+
+    Exceptions (including skips) are captured per dataset and re-raised by
+    the test for that dataset, so one missing file does not affect the others.
 
-    Downloads a recent TV NGrams file and prints sample data to understand the schema.
-    TV NGrams are TAB-delimited with 5 columns: DATE, STATION, HOUR, WORD, COUNT.
+    Args:
+        http_client: Shared HTTP client
+
+    Returns:
+        Sample or exception for each dataset, keyed by dataset name
     """
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # TV NGrams uses station-specific file lists
-        # Try CNN as it's a common station
-        filelist_url = "http://data.gdeltproject.org/gdeltv3/iatv/ngrams/FILELIST-CNN.TXT"
-
-        try:
-            response = await client.get(filelist_url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"TV NGrams filelist not found: {filelist_url}")
-            raise
-
-        # Parse the file list (one URL per line)
-        filelist_content = response.text.strip()
-        lines = filelist_content.split("\n")
-
-        # Find a recent 1gram file
-        tv_ngrams_url = None
-        for line in reversed(lines[-20:]):  # Check last 20 entries (most recent)
-            if "1gram" in line and line.strip().endswith(".gz"):
-                tv_ngrams_url = line.strip()
-                break
+    samples = await asyncio.gather(
+        _sample_vgkg(http_client),
+        _sample_tv_gkg(http_client),
+        _sample_tv_ngrams(http_client),
+        _sample_radio_ngrams(http_client),
+        return_exceptions=True,
+    )
+    return dict(zip(("vgkg", "tv_gkg", "tv_ngrams", "radio_ngrams"), samples, strict=True))
 
-        if not tv_ngrams_url:
-            pytest.skip("No TV NGrams 1gram file found in filelist")
 
-        # Type narrowing: after skip, tv_ngrams_url is str
-        assert tv_ngrams_url is not None
+def _unwrap(sample: DatasetSample) -> tuple[str, bytes]:
+    """Return a dataset sample, re-raising the exception captured for it.
 
-        # Download the file
-        try:
-            logger.info("Downloading TV NGrams file: %s", tv_ngrams_url)
-            response = await client.get(tv_ngrams_url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"TV NGrams file not found: {tv_ngrams_url}")
-            raise
+    Args:
+        sample: Sample or exception from ``dataset_samples``
 
-        # Decompress
-        content = _extract_gzip(response.content)
+    Returns:
+        Tuple of (file_url, content)
 
-        # Print sample TAB-delimited records
-        _print_sample_data("TV NGrams", tv_ngrams_url, content, max_rows=5)
+    Raises:
+        BaseException: The skip or error raised while downloading the sample
+    """
+    if isinstance(sample, BaseException):
+        raise sample
+    return sample
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(180)
-async def test_radio_ngrams_schema_discovery() -> None:
-    """Discover schema for Radio NGrams dataset.
+def test_vgkg_schema_discovery(dataset_samples: dict[str, DatasetSample]) -> None:
+    """Discover schema for the VGKG v2 dataset by printing sample rows."""
+    file_url, content = _unwrap(dataset_samples["vgkg"])
+    _print_sample_data("VGKG v2", file_url, content, max_rows=3)
 
-    Downloads a Radio NGrams file and prints sample data to understand the schema.
-    Radio NGrams are TAB-delimited with 6 columns: DATE, STATION, HOUR, NGRAM, COUNT, SHOW.
-    """
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # The Radio NGrams directory has daily YYYYMMDD.txt inventory files
-        # Use a known working date (2023) since recent data may not be available
-        inventory_url = f"{RADIO_NGRAMS_INVENTORY_URL}20230101.txt"
-
-        try:
-            response = await client.get(inventory_url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"Radio NGrams inventory not found: {inventory_url}")
-            raise
-
-        # Parse inventory file (one URL per line)
-        inventory_content = response.text.strip()
-        lines = inventory_content.split("\n")
-
-        # Find a 1gram file
-        radio_ngrams_url = None
-        for raw_line in lines:
-            line = raw_line.strip()
-            if "1gram" in line and line.endswith(".gz"):
-                radio_ngrams_url = line
-                break
 
-        if not radio_ngrams_url:
-            pytest.skip("No Radio NGrams 1gram file found in inventory")
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.timeout(180)
+def test_tv_gkg_schema_discovery(dataset_samples: dict[str, DatasetSample]) -> None:
+    """Discover schema for the TV-GKG dataset by printing sample rows."""
+    file_url, content = _unwrap(dataset_samples["tv_gkg"])
+    _print_sample_data("TV-GKG", file_url, content, max_rows=3)
 
-        # Type narrowing
-        assert radio_ngrams_url is not None
 
-        # Download the file
-        try:
-            logger.info("Downloading Radio NGrams file: %s", radio_ngrams_url)
-            response = await client.get(radio_ngrams_url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                pytest.skip(f"Radio NGrams file not found: {radio_ngrams_url}")
-            raise
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.timeout(180)
+def test_tv_ngrams_schema_discovery(dataset_samples: dict[str, DatasetSample]) -> None:
+    """Discover schema for the TV NGrams dataset by printing sample rows."""
+    file_url, content = _unwrap(dataset_samples["tv_ngrams"])
+    _print_sample_data("TV NGrams", file_url, content, max_rows=5)
 
-        # Decompress
-        content = _extract_gzip(response.content)
 
-        # Print sample TAB-delimited records
-        _print_sample_data("Radio NGrams", radio_ngrams_url, content, max_rows=5)
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.timeout(180)
+def test_radio_ngrams_schema_discovery(dataset_samples: dict[str, DatasetSample]) -> None:
+    """Discover schema for the Radio NGrams dataset by printing sample rows."""
+    file_url, content = _unwrap(dataset_samples["radio_ngrams"])
+    _print_sample_data("Radio NGrams", file_url, content, max_rows=5)
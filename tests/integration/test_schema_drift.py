@@ -5,23 +5,97 @@ and lookup tables. They emit warnings (not failures) when drift is detected,
 allowing us to identify when GDELT introduces new codes or fields.
 
 Run these tests:
-    pytest tests/integration/test_schema_drift.py -m integration
+    pytest tests/integration/test_schema_drift.py -m integration --run-integration
 """
 
 from __future__ import annotations
 
 import warnings
-from datetime import date, timedelta
-from typing import TYPE_CHECKING
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Final, TypeVar
 
 import pytest
 
-from py_gdelt.filters import DateRange, EventFilter, GKGFilter
 from py_gdelt.lookups import CAMEOCodes, Countries, GKGThemes
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Set as AbstractSet
+
     from py_gdelt import GDELTClient
+    from py_gdelt.filters import EventFilter
+    from py_gdelt.models import GKGRecord
+
+T = TypeVar("T")
+
+# Expected fields from Article model
+DOC_EXPECTED_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "url",
+        "title",
+        "seendate",
+        "domain",
+        "source_country",
+        "language",
+        "socialimage",
+        "tone",
+        "share_count",
+    }
+)
+
+# Expected top-level fields from Event model
+EVENT_EXPECTED_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "global_event_id",
+        "date",
+        "date_added",
+        "source_url",
+        "actor1",
+        "actor2",
+        "event_code",
+        "event_base_code",
+        "event_root_code",
+        "quad_class",
+        "goldstein_scale",
+        "num_mentions",
+        "num_sources",
+        "num_articles",
+        "avg_tone",
+        "is_root_event",
+        "actor1_geo",
+        "actor2_geo",
+        "action_geo",
+        "version",
+        "is_translated",
+        "original_record_id",
+    }
+)
+
+# Expected top-level fields from GKGRecord model
+GKG_EXPECTED_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "record_id",
+        "date",
+        "source_url",
+        "source_name",
+        "source_collection",
+        "themes",
+        "persons",
+        "organizations",
+        "locations",
+        "tone",
+        "gcam",
+        "quotations",
+        "amounts",
+        "sharing_image",
+        "all_names",
+        "version",
+        "is_translated",
+        "original_record_id",
+        "translation_info",
+    }
+)
 
 
 class SchemaDriftWarning(UserWarning):
@@ -40,7 +114,10 @@ class UnknownCodeWarning(UserWarning):
     """
 
 
-def get_drift(expected_fields: set[str], actual_fields: set[str]) -> tuple[set[str], set[str]]:
+def get_drift(
+    expected_fields: AbstractSet[str],
+    actual_fields: AbstractSet[str],
+) -> tuple[AbstractSet[str], AbstractSet[str]]:
     """Calculate schema drift between expected and actual fields.
 
     Args:
@@ -57,8 +134,57 @@ def get_drift(expected_fields: set[str], actual_fields: set[str]) -> tuple[set[s
     return missing, extra
 
 
+async def take(stream: AsyncIterator[T], n: int) -> list[T]:
+    """Collect the first items of a stream and close it.
+
+    Closing the generator right away stops it from downloading and parsing
+    further files once enough items have been read.
+
+    Args:
+        stream: Async iterator to read from
+        n: Maximum number of items to collect
+
+    Returns:
+        Up to n items from the start of the stream
+    """
+    items: list[T] = []
+    try:
+        async for item in stream:
+            items.append(item)
+            if len(items) >= n:
+                break
+    finally:
+        if isinstance(stream, AsyncGenerator):
+            await stream.aclose()
+    return items
+
+
+def partition_codes(
+    codes: set[str],
+    lookup: CAMEOCodes | Countries | GKGThemes,
+) -> tuple[list[str], list[str]]:
+    """Split codes into those found in a lookup table and those that are not.
+
+    Each code is checked against the lookup once.
+
+    Args:
+        codes: Codes collected from live data
+        lookup: Lookup table to check codes against
+
+    Returns:
+        Tuple of (known_codes, unknown_codes), each sorted
+    """
+    known: list[str] = []
+    unknown: list[str] = []
+    for code in sorted(codes):
+        if code in lookup:
+            known.append(code)
+        else:
+            unknown.append(code)
+    return known, unknown
+
+
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.timeout(30)
 async def test_doc_api_schema_drift(gdelt_client: GDELTClient) -> None:
     """Test DOC API response fields match Article model.
@@ -72,24 +198,11 @@ async def test_doc_api_schema_drift(gdelt_client: GDELTClient) -> None:
     if not articles:
         pytest.skip("No articles returned from DOC API")
 
-    # Expected fields from Article model
-    expected_fields = {
-        "url",
-        "title",
-        "seendate",
-        "domain",
-        "source_country",
-        "language",
-        "socialimage",
-        "tone",
-        "share_count",
-    }
-
     # Check first article for schema drift
     article = articles[0]
-    actual_fields = set(article.model_dump().keys())
+    actual_fields = set(type(article).model_fields)
 
-    missing, extra = get_drift(expected_fields, actual_fields)
+    missing, extra = get_drift(DOC_EXPECTED_FIELDS, actual_fields)
 
     if missing:
         warnings.warn(
@@ -110,65 +223,28 @@ async def test_doc_api_schema_drift(gdelt_client: GDELTClient) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(120)
-async def test_events_file_schema_drift(gdelt_client: GDELTClient) -> None:
+async def test_events_file_schema_drift(
+    gdelt_client: GDELTClient,
+    ref_date_event_filter: EventFilter,
+) -> None:
     """Test Events file download fields match Event model.
 
     Validates that Event objects parsed from downloaded files contain
     all expected fields and warns if new fields appear.
     """
-    # Use recent date to ensure data exists
-    yesterday = date.today() - timedelta(days=2)
-
-    event_filter = EventFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-    )
-
     # Stream a few events to check schema
-    count = 0
-    events_to_check = []
-    async for event in gdelt_client.events.stream(event_filter):
-        events_to_check.append(event)
-        count += 1
-        if count >= 5:
-            break
+    events_to_check = await take(gdelt_client.events.stream(ref_date_event_filter), 5)
 
     if not events_to_check:
         pytest.skip("No events returned - files may be temporarily unavailable")
 
-    # Expected top-level fields from Event model
-    expected_fields = {
-        "global_event_id",
-        "date",
-        "date_added",
-        "source_url",
-        "actor1",
-        "actor2",
-        "event_code",
-        "event_base_code",
-        "event_root_code",
-        "quad_class",
-        "goldstein_scale",
-        "num_mentions",
-        "num_sources",
-        "num_articles",
-        "avg_tone",
-        "is_root_event",
-        "actor1_geo",
-        "actor2_geo",
-        "action_geo",
-        "version",
-        "is_translated",
-        "original_record_id",
-    }
-
     # Check first event for schema drift
     event = events_to_check[0]
-    actual_fields = set(event.model_dump().keys())
+    actual_fields = set(type(event).model_fields)
 
-    missing, extra = get_drift(expected_fields, actual_fields)
+    missing, extra = get_drift(EVENT_EXPECTED_FIELDS, actual_fields)
 
     if missing:
         warnings.warn(
@@ -190,62 +266,24 @@ async def test_events_file_schema_drift(gdelt_client: GDELTClient) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(120)
-async def test_gkg_file_schema_drift(gdelt_client: GDELTClient) -> None:
+async def test_gkg_file_schema_drift(ref_date_gkg_sample: list[GKGRecord]) -> None:
     """Test GKG file download fields match GKGRecord model.
 
     Validates that GKGRecord objects parsed from downloaded files contain
     all expected fields and warns if new fields appear.
     """
-    # Use recent date to ensure data exists
-    yesterday = date.today() - timedelta(days=2)
-
-    gkg_filter = GKGFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-    )
-
-    # Stream a few records to check schema
-    count = 0
-    records_to_check = []
-    async for record in gdelt_client.gkg.stream(gkg_filter):
-        records_to_check.append(record)
-        count += 1
-        if count >= 5:
-            break
+    records_to_check = ref_date_gkg_sample[:5]
 
     if not records_to_check:
         pytest.skip("No GKG records returned - files may be temporarily unavailable")
 
-    # Expected top-level fields from GKGRecord model
-    expected_fields = {
-        "record_id",
-        "date",
-        "source_url",
-        "source_name",
-        "source_collection",
-        "themes",
-        "persons",
-        "organizations",
-        "locations",
-        "tone",
-        "gcam",
-        "quotations",
-        "amounts",
-        "sharing_image",
-        "all_names",
-        "version",
-        "is_translated",
-        "original_record_id",
-        "translation_info",
-    }
-
     # Check first record for schema drift
     record = records_to_check[0]
-    actual_fields = set(record.model_dump().keys())
+    actual_fields = set(type(record).model_fields)
 
-    missing, extra = get_drift(expected_fields, actual_fields)
+    missing, extra = get_drift(GKG_EXPECTED_FIELDS, actual_fields)
 
     if missing:
         warnings.warn(
@@ -267,42 +305,29 @@ async def test_gkg_file_schema_drift(gdelt_client: GDELTClient) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(120)
-async def test_cameo_codes_coverage(gdelt_client: GDELTClient) -> None:
+async def test_cameo_codes_coverage(
+    gdelt_client: GDELTClient,
+    ref_date_event_filter: EventFilter,
+) -> None:
     """Test that CAMEO codes in live data exist in lookup tables.
 
     Collects CAMEO event codes from live events and validates them
     against our lookup table, warning if unknown codes are found.
     """
-    # Use recent date to ensure data exists
-    yesterday = date.today() - timedelta(days=2)
-
-    event_filter = EventFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-    )
-
     # Collect event codes from live data
-    event_codes = set()
-    count = 0
-    async for event in gdelt_client.events.stream(event_filter):
-        if event.event_code:
-            event_codes.add(event.event_code)
-        if event.event_base_code:
-            event_codes.add(event.event_base_code)
-        if event.event_root_code:
-            event_codes.add(event.event_root_code)
-        count += 1
-        if count >= 100:
-            break
+    event_codes: set[str] = set()
+    for event in await take(gdelt_client.events.stream(ref_date_event_filter), 100):
+        event_codes.update(
+            filter(None, (event.event_code, event.event_base_code, event.event_root_code))
+        )
 
     if not event_codes:
         pytest.skip("No event codes collected from live data")
 
     # Check against lookup table
-    cameo = CAMEOCodes()
-    unknown_codes = [code for code in sorted(event_codes) if code not in cameo]
+    known_codes, unknown_codes = partition_codes(event_codes, CAMEOCodes())
 
     if unknown_codes:
         warnings.warn(
@@ -312,55 +337,43 @@ async def test_cameo_codes_coverage(gdelt_client: GDELTClient) -> None:
         )
 
     # Should find at least some known codes
-    known_codes = [code for code in event_codes if code in cameo]
     assert len(known_codes) > 0, "Expected to find at least some known CAMEO codes"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(120)
-async def test_country_codes_coverage(gdelt_client: GDELTClient) -> None:
+async def test_country_codes_coverage(
+    gdelt_client: GDELTClient,
+    ref_date_event_filter: EventFilter,
+) -> None:
     """Test that country codes in live data exist in lookup tables.
 
     Collects country codes from live events and validates them
     against our lookup table, warning if unknown codes are found.
     """
-    # Use recent date to ensure data exists
-    yesterday = date.today() - timedelta(days=2)
-
-    event_filter = EventFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-    )
-
     # Collect country codes from live data
-    country_codes = set()
-    count = 0
-    async for event in gdelt_client.events.stream(event_filter):
-        # Access country codes via nested Actor objects
-        if event.actor1 and event.actor1.country_code:
-            country_codes.add(event.actor1.country_code)
-        if event.actor2 and event.actor2.country_code:
-            country_codes.add(event.actor2.country_code)
+    country_codes: set[str] = set()
+    for event in await take(gdelt_client.events.stream(ref_date_event_filter), 100):
+        # Access country codes via nested Actor objects (each read once)
+        if (actor1 := event.actor1) and (code := actor1.country_code):
+            country_codes.add(code)
+        if (actor2 := event.actor2) and (code := actor2.country_code):
+            country_codes.add(code)
 
         # Also check geo country codes
-        if event.actor1_geo and event.actor1_geo.country_code:
-            country_codes.add(event.actor1_geo.country_code)
-        if event.actor2_geo and event.actor2_geo.country_code:
-            country_codes.add(event.actor2_geo.country_code)
-        if event.action_geo and event.action_geo.country_code:
-            country_codes.add(event.action_geo.country_code)
-
-        count += 1
-        if count >= 100:
-            break
+        if (actor1_geo := event.actor1_geo) and (code := actor1_geo.country_code):
+            country_codes.add(code)
+        if (actor2_geo := event.actor2_geo) and (code := actor2_geo.country_code):
+            country_codes.add(code)
+        if (action_geo := event.action_geo) and (code := action_geo.country_code):
+            country_codes.add(code)
 
     if not country_codes:
         pytest.skip("No country codes collected from live data")
 
     # Check against lookup table
-    countries = Countries()
-    unknown_codes = [code for code in sorted(country_codes) if code not in countries]
+    known_codes, unknown_codes = partition_codes(country_codes, Countries())
 
     if unknown_codes:
         warnings.warn(
@@ -370,46 +383,28 @@ async def test_country_codes_coverage(gdelt_client: GDELTClient) -> None:
         )
 
     # Should find at least some known codes
-    known_codes = [code for code in country_codes if code in countries]
     assert len(known_codes) > 0, "Expected to find at least some known country codes"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(120)
-async def test_gkg_themes_coverage(gdelt_client: GDELTClient) -> None:
+async def test_gkg_themes_coverage(ref_date_gkg_sample: list[GKGRecord]) -> None:
     """Test that GKG themes in live data exist in lookup tables.
 
     Collects GKG theme codes from live data and validates them
     against our lookup table, warning if unknown themes are found.
     """
-    # Use recent date to ensure data exists
-    yesterday = date.today() - timedelta(days=2)
-
-    gkg_filter = GKGFilter(
-        date_range=DateRange(start=yesterday, end=yesterday),
-    )
-
-    # Collect theme codes from live data
-    theme_codes = set()
-    count = 0
-    async for record in gdelt_client.gkg.stream(gkg_filter):
-        # Themes is list[EntityMention], access theme names via .name
-        for theme in record.themes:
-            if theme.name:
-                theme_codes.add(theme.name)
-
-        count += 1
-        if count >= 50:
-            break
+    # Themes is list[EntityMention], access theme names via .name
+    theme_codes = {
+        theme.name for record in ref_date_gkg_sample for theme in record.themes if theme.name
+    }
 
     if not theme_codes:
         pytest.skip("No GKG themes collected from live data")
 
     # Check against lookup table
-    themes = GKGThemes()
-    unknown_themes = [theme_code for theme_code in sorted(theme_codes) if theme_code not in themes]
+    known_themes, unknown_themes = partition_codes(theme_codes, GKGThemes())
 
     if unknown_themes:
         # Only warn about first 20 to avoid overwhelming output
@@ -424,5 +419,4 @@ async def test_gkg_themes_coverage(gdelt_client: GDELTClient) -> None:
         )
 
     # Should find at least some known themes
-    known_themes = [theme for theme in theme_codes if theme in themes]
     assert len(known_themes) > 0, "Expected to find at least some known GKG themes"
@@ -8,21 +8,47 @@ Note: GDELT TV API only has data from Internet Archive up to ~2020, so we use
 from datetime import datetime
 
 import pytest
+import pytest_asyncio
 
 from py_gdelt import GDELTClient
+from py_gdelt.endpoints import TVClip
 
 
 # Use historical dates known to have TV data (Internet Archive coverage ends ~2020)
 TV_TEST_START = datetime(2020, 1, 1)
 TV_TEST_END = datetime(2020, 1, 7)
 
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_tv_search_returns_clips(gdelt_client: GDELTClient) -> None:
-    """Test TV search returns clips with expected structure."""
-    clips = await gdelt_client.tv.search(
+# Per-test timeout (seconds). A live fixed-date TV query returns in a few
+# seconds, so a hung request fails in 20s rather than holding a worker for the
+# 60s integration default.
+TV_TEST_TIMEOUT = 20
+
+# Skip fast if the API is down; fixed dates keep opt-in cassettes (make
+# integration-record / integration-replay) valid indefinitely
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.timeout(TV_TEST_TIMEOUT),
+    pytest.mark.usefixtures("gdelt_api_available", "vcr_cassette"),
+]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def cnn_politics_clips(
+    gdelt_client: GDELTClient,
+    gdelt_api_available: None,
+    vcr_cassette: None,
+) -> list[TVClip]:
+    """Search CNN politics clips once for the tests that only inspect clips.
+
+    Args:
+        gdelt_client: Shared GDELT client.
+        gdelt_api_available: Skips the module if the API is unreachable.
+        vcr_cassette: Module cassette, active before the search is made.
+
+    Returns:
+        list[TVClip]: Up to 10 CNN politics clips from the test week.
+    """
+    return await gdelt_client.tv.search(
         "politics",
         station="CNN",  # GDELT TV API requires station
         start_datetime=TV_TEST_START,
@@ -30,6 +56,11 @@ async def test_tv_search_returns_clips(gdelt_client: GDELTClient) -> None:
         max_results=10,
     )
 
+
+async def test_tv_search_returns_clips(cnn_politics_clips: list[TVClip]) -> None:
+    """Test TV search returns clips with expected structure."""
+    clips = cnn_politics_clips
+
     assert isinstance(clips, list)
 
     if not clips:
@@ -41,9 +72,6 @@ async def test_tv_search_returns_clips(gdelt_client: GDELTClient) -> None:
     assert clip.station, "Station should be non-empty"
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_tv_timeline(gdelt_client: GDELTClient) -> None:
     """Test TV timeline returns data points."""
     timeline = await gdelt_client.tv.timeline(
@@ -57,18 +85,9 @@ async def test_tv_timeline(gdelt_client: GDELTClient) -> None:
     assert isinstance(timeline.points, list)
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_tv_search_by_station(gdelt_client: GDELTClient) -> None:
+async def test_tv_search_by_station(cnn_politics_clips: list[TVClip]) -> None:
     """Test filtering by specific station."""
-    clips = await gdelt_client.tv.search(
-        "economy",
-        station="CNN",
-        start_datetime=TV_TEST_START,
-        end_datetime=TV_TEST_END,
-        max_results=5,
-    )
+    clips = cnn_politics_clips
 
     assert isinstance(clips, list)
 
@@ -76,22 +95,13 @@ async def test_tv_search_by_station(gdelt_client: GDELTClient) -> None:
         pytest.skip("No clips returned for station filter test")
 
     # Verify station filtering works
-    for clip in clips:
-        assert clip.station == "CNN", f"Expected CNN, got {clip.station}"
+    other_stations = {clip.station for clip in clips} - {"CNN"}
+    assert not other_stations, f"Expected only CNN, got {other_stations}"
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
-async def test_tv_clip_attributes(gdelt_client: GDELTClient) -> None:
+async def test_tv_clip_attributes(cnn_politics_clips: list[TVClip]) -> None:
     """Test that TV clips have expected attributes."""
-    clips = await gdelt_client.tv.search(
-        "technology",
-        station="CNN",  # GDELT TV API requires station
-        start_datetime=TV_TEST_START,
-        end_datetime=TV_TEST_END,
-        max_results=3,
-    )
+    clips = cnn_politics_clips
 
     if not clips:
         pytest.skip("No clips returned for attribute test")
@@ -105,9 +115,6 @@ async def test_tv_clip_attributes(gdelt_client: GDELTClient) -> None:
     assert hasattr(clip, "snippet"), "Clip should have snippet attribute"
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_tv_max_results_parameter(gdelt_client: GDELTClient) -> None:
     """Test max_results parameter limits results."""
     max_results = 5
@@ -124,9 +131,6 @@ async def test_tv_max_results_parameter(gdelt_client: GDELTClient) -> None:
     assert len(clips) <= max_results
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-@pytest.mark.timeout(60)
 async def test_tv_timeline_data_points(gdelt_client: GDELTClient) -> None:
     """Test timeline data points have expected structure."""
     timeline = await gdelt_client.tv.timeline(
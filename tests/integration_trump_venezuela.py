@@ -6,174 +6,196 @@ Trump and Venezuela, demonstrating real API usage.
 """
 
 import asyncio
+import re
+from collections import Counter
 
 from py_gdelt import GDELTClient
 from py_gdelt.filters import DocFilter
 
 
-async def search_trump_venezuela() -> None:
-    """Search for recent Trump + Venezuela news."""
-    print("=" * 70)
-    print("GDELT Integration Test: Trump + Venezuela (This Week)")
-    print("=" * 70)
-
-    async with GDELTClient() as client:
-        # Search DOC API for articles
-        print("\nSearching GDELT DOC API for 'Trump Venezuela'...")
-
-        doc_filter = DocFilter(
-            query="Trump Venezuela",
-            timespan="7d",  # Last 7 days
-            max_results=50,
-            sort_by="date",  # Most recent first
-            source_language="english",  # English articles only
+# Domains of non-English outlets (GDELT sometimes ignores the language filter)
+NON_ENGLISH_DOMAINS = (
+    ".ru",
+    ".kr",
+    ".cn",
+    ".jp",
+    ".ua",
+    ".il",
+    ".fi",
+    ".uk.co",
+    "qianlong.com",
+    "vetogate.com",
+    "alquds.co",
+    "youm7.com",
+    "webdunia.com",
+    "centralasia.media",
+    "israelinfo.co",
+    "liga.net",
+    "iltalehti.fi",
+    "unian.net",
+    "glavred.info",
+    "heraldcorp.com",
+    "hankookilbo.com",
+    "koreatimes.com",
+    "fnnews.com",
+)
+
+# Single alternation so each domain is checked in one regex scan
+NON_ENGLISH_RE = re.compile("|".join(map(re.escape, NON_ENGLISH_DOMAINS)))
+
+# Headline keywords to tally in the summary
+HEADLINE_KEYWORDS = (
+    "tariff",
+    "oil",
+    "sanction",
+    "maduro",
+    "guaido",
+    "military",
+    "invasion",
+    "threat",
+    "economy",
+    "crisis",
+    "panama",
+    "canal",
+    "deportation",
+    "immigration",
+)
+
+# Anchored at a word start so "oil" does not match "boiling", while plurals
+# such as "sanctions" and "tariffs" still count
+HEADLINE_KEYWORDS_RE = re.compile(r"\b(" + "|".join(HEADLINE_KEYWORDS) + ")")
+
+# DOC API seendate, e.g. 20260103T174500Z -> 2026-01-03 17:45
+SEENDATE_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})\d{2}Z?$")
+SEENDATE_FORMAT = r"\1-\2-\3 \4:\5"
+
+
+async def search_trump_venezuela(client: GDELTClient) -> None:
+    """Search for recent Trump + Venezuela news.
+
+    Output is printed only once the query returns, so it is not interleaved
+    with other searches running concurrently on the same client.
+
+    Args:
+        client: Shared GDELT client.
+    """
+    doc_filter = DocFilter(
+        query="Trump Venezuela",
+        timespan="7d",  # Last 7 days
+        max_results=50,
+        sort_by="date",  # Most recent first
+        source_language="english",  # English articles only
+    )
+
+    try:
+        articles = await client.doc.query(doc_filter)
+
+        print("=" * 70)
+        print("GDELT Integration Test: Trump + Venezuela (This Week)")
+        print("=" * 70)
+        print("\nSearched GDELT DOC API for 'Trump Venezuela'")
+
+        # Filter for English articles client-side (GDELT sometimes ignores language filter)
+        english_articles = [
+            a
+            for a in articles
+            if a.is_english or (a.domain and not NON_ENGLISH_RE.search(a.domain))
+        ]
+
+        print(
+            f"\nFound {len(articles)} total articles, {len(english_articles)} likely English\n",
+        )
+        print("-" * 70)
+
+        for i, article in enumerate(english_articles[:20], 1):  # Show top 20
+            print(f"\n{i}. {article.title}")
+            # Reformat DOC API seendates; other date formats are printed as-is
+            date_str = SEENDATE_RE.sub(SEENDATE_FORMAT, article.seendate or "Unknown")
+            print(f"   Date: {date_str}")
+            print(f"   Source: {article.domain}")
+            print(f"   URL: {article.url[:80]}...")
+
+            # Show tone if available
+            if article.tone is not None:
+                tone_label = (
+                    "positive"
+                    if article.tone > 0
+                    else "negative"
+                    if article.tone < 0
+                    else "neutral"
+                )
+                print(f"   Tone: {article.tone:.2f} ({tone_label})")
+
+        print("\n" + "-" * 70)
+        print(f"\nTotal English articles: {len(english_articles)}")
+
+        # Summary
+        if english_articles:
+            print("\n" + "=" * 70)
+            print("SUMMARY: Key topics from headlines")
+            print("=" * 70)
+
+            # Extract common themes from titles (each keyword counted once per title)
+            keywords: Counter[str] = Counter()
+            for article in english_articles:
+                keywords.update(set(HEADLINE_KEYWORDS_RE.findall(article.title.lower())))
+
+            if keywords:
+                print("\nKeywords found in headlines:")
+                for word, count in keywords.most_common():
+                    print(f"  - {word}: {count} mentions")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+
+        traceback.print_exc()
+
+
+async def search_events_venezuela(client: GDELTClient) -> None:
+    """Search for events involving Venezuela.
+
+    Args:
+        client: Shared GDELT client.
+    """
+    try:
+        from py_gdelt.filters import GeoFilter
+
+        geo_filter = GeoFilter(
+            query="Venezuela Trump",
+            timespan="7d",
         )
 
-        try:
-            articles = await client.doc.query(doc_filter)
-
-            # Filter for English articles client-side (GDELT sometimes ignores language filter)
-            non_english_domains = (
-                ".ru",
-                ".kr",
-                ".cn",
-                ".jp",
-                ".ua",
-                ".il",
-                ".fi",
-                ".uk.co",
-                "qianlong.com",
-                "vetogate.com",
-                "alquds.co",
-                "youm7.com",
-                "webdunia.com",
-                "centralasia.media",
-                "israelinfo.co",
-                "liga.net",
-                "iltalehti.fi",
-                "unian.net",
-                "glavred.info",
-                "heraldcorp.com",
-                "hankookilbo.com",
-                "koreatimes.com",
-                "fnnews.com",
-            )
-            english_articles = [
-                a
-                for a in articles
-                if a.is_english
-                or (a.domain and not any(d in a.domain for d in non_english_domains))
-            ]
-
-            print(
-                f"\nFound {len(articles)} total articles, {len(english_articles)} likely English\n",
-            )
-            print("-" * 70)
-
-            for i, article in enumerate(english_articles[:20], 1):  # Show top 20
-                print(f"\n{i}. {article.title}")
-                # Parse the date - handle various formats
-                date_str = article.seendate or "Unknown"
-                if date_str and "T" in date_str:
-                    # Format: 20260103T174500Z -> 2026-01-03 17:45
-                    try:
-                        date_str = f"{date_str[0:4]}-{date_str[4:6]}-{date_str[6:8]} {date_str[9:11]}:{date_str[11:13]}"
-                    except (IndexError, ValueError):
-                        pass
-                print(f"   Date: {date_str}")
-                print(f"   Source: {article.domain}")
-                print(f"   URL: {article.url[:80]}...")
-
-                # Show tone if available
-                if article.tone is not None:
-                    tone_label = (
-                        "positive"
-                        if article.tone > 0
-                        else "negative"
-                        if article.tone < 0
-                        else "neutral"
-                    )
-                    print(f"   Tone: {article.tone:.2f} ({tone_label})")
-
-            print("\n" + "-" * 70)
-            print(f"\nTotal English articles: {len(english_articles)}")
-
-            # Summary
-            if english_articles:
-                print("\n" + "=" * 70)
-                print("SUMMARY: Key topics from headlines")
-                print("=" * 70)
-
-                # Extract common themes from titles
-                keywords = {}
-                for article in english_articles:
-                    title_lower = article.title.lower()
-                    for word in [
-                        "tariff",
-                        "oil",
-                        "sanction",
-                        "maduro",
-                        "guaido",
-                        "military",
-                        "invasion",
-                        "threat",
-                        "economy",
-                        "crisis",
-                        "panama",
-                        "canal",
-                        "deportation",
-                        "immigration",
-                    ]:
-                        if word in title_lower:
-                            keywords[word] = keywords.get(word, 0) + 1
-
-                if keywords:
-                    print("\nKeywords found in headlines:")
-                    for word, count in sorted(keywords.items(), key=lambda x: -x[1]):
-                        print(f"  - {word}: {count} mentions")
-
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-
-            traceback.print_exc()
-
-
-async def search_events_venezuela() -> None:
-    """Search for events involving Venezuela."""
-    print("\n" + "=" * 70)
-    print("Searching GDELT Events for Venezuela (if files available)")
-    print("=" * 70)
+        geo_results = await client.geo.query(geo_filter)
 
-    async with GDELTClient() as client:
-        # Try GEO API for geographic context
-        print("\nSearching GEO API for Venezuela-related coverage...")
+        print("\n" + "=" * 70)
+        print("Searching GDELT Events for Venezuela (if files available)")
+        print("=" * 70)
+        print("\nSearched GEO API for Venezuela-related coverage")
 
-        try:
-            from py_gdelt.filters import GeoFilter
+        if geo_results:
+            print(f"Found {len(geo_results)} geographic features")
+            for feat in geo_results[:5]:
+                print(f"  - {feat}")
+        else:
+            print("No geographic results")
 
-            geo_filter = GeoFilter(
-                query="Venezuela Trump",
-                timespan="7d",
-            )
+    except Exception as e:
+        print(f"GEO API error (expected if no results): {e}")
 
-            geo_results = await client.geo.query(geo_filter)
 
-            if geo_results:
-                print(f"Found {len(geo_results)} geographic features")
-                for feat in geo_results[:5]:
-                    print(f"  - {feat}")
-            else:
-                print("No geographic results")
-
-        except Exception as e:
-            print(f"GEO API error (expected if no results): {e}")
+async def run() -> None:
+    """Run the searches concurrently over one shared client."""
+    async with GDELTClient() as client:
+        await asyncio.gather(
+            search_trump_venezuela(client),
+            search_events_venezuela(client),
+        )
 
 
 def main() -> None:
     """Run the integration test."""
-    asyncio.run(search_trump_venezuela())
-    # asyncio.run(search_events_venezuela())  # Optional
+    asyncio.run(run())
 
 
 if __name__ == "__main__":
@@ -12,10 +12,11 @@ This module tests:
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
+import pytest_asyncio
 
 from py_gdelt import GDELTClient, GDELTSettings
 from py_gdelt.endpoints import (
@@ -33,9 +34,66 @@ from py_gdelt.lookups import Lookups
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
     from pathlib import Path
 
 
+@pytest_asyncio.fixture(scope="module")
+async def shared_client() -> AsyncIterator[GDELTClient]:
+    """Provide one initialized client for tests that only read its attributes.
+
+    Lifecycle tests still build their own client.
+
+    Yields:
+        GDELTClient: Client entered once for the whole module.
+    """
+    async with GDELTClient() as client:
+        yield client
+
+
+@pytest.fixture
+def bigquery_settings() -> GDELTSettings:
+    """Provide settings with BigQuery credentials configured.
+
+    Returns:
+        GDELTSettings: Settings that make the client create a BigQuerySource.
+    """
+    return GDELTSettings(
+        bigquery_project="test-project",
+        bigquery_credentials="/path/to/creds.json",
+    )
+
+
+@pytest.fixture
+def mock_bigquery_source() -> Iterator[MagicMock]:
+    """Patch BigQuerySource in the client module.
+
+    Yields:
+        MagicMock: The patched class; set side_effect to simulate init failure.
+    """
+    with patch("py_gdelt.client.BigQuerySource") as mock_bq:
+        yield mock_bq
+
+
+@pytest.fixture(scope="module")
+def config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a TOML config file once for the config_path tests.
+
+    Args:
+        tmp_path_factory: Pytest temporary directory factory.
+
+    Returns:
+        Path: Config file setting timeout = 45 and max_retries = 4.
+    """
+    path = tmp_path_factory.mktemp("config") / "test_gdelt.toml"
+    path.write_text("""
+[gdelt]
+timeout = 45
+max_retries = 4
+""")
+    return path
+
+
 class TestGDELTClientInit:
     """Test client initialization with various configurations."""
 
@@ -56,25 +114,14 @@ class TestGDELTClientInit:
         assert client.settings.timeout == 60
         assert client.settings.max_retries == 5
 
-    def test_init_with_config_path(self, tmp_path: Path) -> None:
+    def test_init_with_config_path(self, config_file: Path) -> None:
         """Test initialization with TOML config file."""
-        config_file = tmp_path / "test_gdelt.toml"
-        config_file.write_text("""
-[gdelt]
-timeout = 45
-max_retries = 4
-""")
         client = GDELTClient(config_path=config_file)
         assert client.settings.timeout == 45
         assert client.settings.max_retries == 4
 
-    def test_init_settings_overrides_config_path(self, tmp_path: Path) -> None:
+    def test_init_settings_overrides_config_path(self, config_file: Path) -> None:
         """Test that settings parameter takes precedence over config_path."""
-        config_file = tmp_path / "test_gdelt.toml"
-        config_file.write_text("""
-[gdelt]
-timeout = 45
-""")
         settings = GDELTSettings(timeout=60)
         client = GDELTClient(settings=settings, config_path=config_file)
         # settings should take precedence
@@ -121,14 +168,14 @@ class TestGDELTClientAsyncContextManager:
     @pytest.mark.asyncio
     async def test_context_manager_does_not_close_injected_client(self) -> None:
         """Test that injected HTTP client is not closed on exit."""
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        client = GDELTClient(http_client=mock_client)
+        async with httpx.AsyncClient() as http_client:
+            client = GDELTClient(http_client=http_client)
 
-        async with client:
-            pass
+            async with client:
+                pass
 
-        # Injected client should NOT be closed
-        mock_client.aclose.assert_not_called()
+            # Injected client should NOT be closed
+            assert not http_client.is_closed
 
     @pytest.mark.asyncio
     async def test_context_manager_closes_owned_client(self) -> None:
@@ -142,45 +189,42 @@ class TestGDELTClientAsyncContextManager:
         # Owned client should be closed (can't easily test without mocking)
         assert client._http_client is None
 
+
+class TestGDELTClientBigQuery:
+    """Test optional BigQuery source setup on context manager entry."""
+
     @pytest.mark.asyncio
-    async def test_bigquery_source_initialized_when_configured(self) -> None:
+    async def test_bigquery_source_initialized_when_configured(
+        self,
+        bigquery_settings: GDELTSettings,
+        mock_bigquery_source: MagicMock,
+    ) -> None:
         """Test that BigQuery source is created when credentials are configured."""
-        settings = GDELTSettings(
-            bigquery_project="test-project",
-            bigquery_credentials="/path/to/creds.json",
-        )
-        client = GDELTClient(settings=settings)
-
-        with patch("py_gdelt.client.BigQuerySource") as mock_bq:
-            mock_bq.return_value = MagicMock()
-            async with client:
-                # BigQuerySource should be initialized
-                mock_bq.assert_called_once_with(settings=settings)
+        async with GDELTClient(settings=bigquery_settings):
+            # BigQuerySource should be initialized
+            mock_bigquery_source.assert_called_once_with(settings=bigquery_settings)
 
     @pytest.mark.asyncio
-    async def test_bigquery_source_not_initialized_without_credentials(self) -> None:
+    async def test_bigquery_source_not_initialized_without_credentials(
+        self,
+        shared_client: GDELTClient,
+    ) -> None:
         """Test that BigQuery source is not created without credentials."""
-        client = GDELTClient()  # No BQ credentials
-
-        async with client:
-            assert client._bigquery_source is None
+        # shared_client uses default settings, so has no BQ credentials
+        assert shared_client._bigquery_source is None
 
     @pytest.mark.asyncio
-    async def test_bigquery_initialization_failure_logged(self) -> None:
+    async def test_bigquery_initialization_failure_logged(
+        self,
+        bigquery_settings: GDELTSettings,
+        mock_bigquery_source: MagicMock,
+    ) -> None:
         """Test that BigQuery initialization failures are logged but don't crash."""
-        settings = GDELTSettings(
-            bigquery_project="test-project",
-            bigquery_credentials="/path/to/creds.json",
-        )
-        client = GDELTClient(settings=settings)
+        mock_bigquery_source.side_effect = Exception("BQ init failed")
 
-        with patch(
-            "py_gdelt.client.BigQuerySource",
-            side_effect=Exception("BQ init failed"),
-        ):
-            # Should not raise, just log warning
-            async with client:
-                assert client._bigquery_source is None
+        # Should not raise, just log warning
+        async with GDELTClient(settings=bigquery_settings) as client:
+            assert client._bigquery_source is None
 
 
 class TestGDELTClientSyncContextManager:
@@ -199,78 +243,32 @@ class TestGDELTClientSyncContextManager:
 class TestGDELTClientEndpointAccess:
     """Test endpoint namespace access."""
 
+    @pytest.mark.parametrize(
+        ("attr", "endpoint_type"),
+        [
+            ("events", EventsEndpoint),
+            ("mentions", MentionsEndpoint),
+            ("gkg", GKGEndpoint),
+            ("ngrams", NGramsEndpoint),
+            ("doc", DocEndpoint),
+            ("geo", GeoEndpoint),
+            ("context", ContextEndpoint),
+            ("tv", TVEndpoint),
+            ("tv_ai", TVAIEndpoint),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_events_endpoint_access(self) -> None:
-        """Test accessing events endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.events
-            assert isinstance(endpoint, EventsEndpoint)
-            # Cached property should return same instance
-            assert client.events is endpoint
-
-    @pytest.mark.asyncio
-    async def test_mentions_endpoint_access(self) -> None:
-        """Test accessing mentions endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.mentions
-            assert isinstance(endpoint, MentionsEndpoint)
-            assert client.mentions is endpoint
-
-    @pytest.mark.asyncio
-    async def test_gkg_endpoint_access(self) -> None:
-        """Test accessing GKG endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.gkg
-            assert isinstance(endpoint, GKGEndpoint)
-            assert client.gkg is endpoint
-
-    @pytest.mark.asyncio
-    async def test_ngrams_endpoint_access(self) -> None:
-        """Test accessing NGrams endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.ngrams
-            assert isinstance(endpoint, NGramsEndpoint)
-            assert client.ngrams is endpoint
-
-    @pytest.mark.asyncio
-    async def test_doc_endpoint_access(self) -> None:
-        """Test accessing DOC endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.doc
-            assert isinstance(endpoint, DocEndpoint)
-            assert client.doc is endpoint
-
-    @pytest.mark.asyncio
-    async def test_geo_endpoint_access(self) -> None:
-        """Test accessing GEO endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.geo
-            assert isinstance(endpoint, GeoEndpoint)
-            assert client.geo is endpoint
-
-    @pytest.mark.asyncio
-    async def test_context_endpoint_access(self) -> None:
-        """Test accessing Context endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.context
-            assert isinstance(endpoint, ContextEndpoint)
-            assert client.context is endpoint
-
-    @pytest.mark.asyncio
-    async def test_tv_endpoint_access(self) -> None:
-        """Test accessing TV endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.tv
-            assert isinstance(endpoint, TVEndpoint)
-            assert client.tv is endpoint
-
-    @pytest.mark.asyncio
-    async def test_tv_ai_endpoint_access(self) -> None:
-        """Test accessing TVAI endpoint."""
-        async with GDELTClient() as client:
-            endpoint = client.tv_ai
-            assert isinstance(endpoint, TVAIEndpoint)
-            assert client.tv_ai is endpoint
+    async def test_endpoint_access(
+        self,
+        shared_client: GDELTClient,
+        attr: str,
+        endpoint_type: type,
+    ) -> None:
+        """Test accessing each endpoint namespace."""
+        endpoint = getattr(shared_client, attr)
+        assert isinstance(endpoint, endpoint_type)
+        # Cached property should return same instance
+        assert getattr(shared_client, attr) is endpoint
 
     def test_endpoint_access_before_initialization_raises(self) -> None:
         """Test that accessing endpoints before initialization raises error."""
@@ -289,13 +287,12 @@ class TestGDELTClientLookups:
     """Test lookup table access."""
 
     @pytest.mark.asyncio
-    async def test_lookups_access(self) -> None:
+    async def test_lookups_access(self, shared_client: GDELTClient) -> None:
         """Test accessing lookup tables."""
-        async with GDELTClient() as client:
-            lookups = client.lookups
-            assert isinstance(lookups, Lookups)
-            # Should be cached
-            assert client.lookups is lookups
+        lookups = shared_client.lookups
+        assert isinstance(lookups, Lookups)
+        # Should be cached
+        assert shared_client.lookups is lookups
 
     def test_lookups_access_before_initialization(self) -> None:
         """Test that lookups can be accessed before initialization.
@@ -308,78 +305,73 @@ class TestGDELTClientLookups:
         assert isinstance(lookups, Lookups)
 
     @pytest.mark.asyncio
-    async def test_lookups_cameo_codes(self) -> None:
+    async def test_lookups_cameo_codes(self, shared_client: GDELTClient) -> None:
         """Test CAMEO code lookup integration."""
-        async with GDELTClient() as client:
-            # Basic lookup should work
-            cameo = client.lookups.cameo
-            assert cameo is not None
-            # Actual lookup verification (assumes CAMEOCodes is implemented)
-            # assert "01" in cameo
+        # Basic lookup should work
+        cameo = shared_client.lookups.cameo
+        assert cameo is not None
+        # Actual lookup verification (assumes CAMEOCodes is implemented)
+        # assert "01" in cameo
 
     @pytest.mark.asyncio
-    async def test_lookups_themes(self) -> None:
+    async def test_lookups_themes(self, shared_client: GDELTClient) -> None:
         """Test GKG themes lookup integration."""
-        async with GDELTClient() as client:
-            themes = client.lookups.themes
-            assert themes is not None
+        themes = shared_client.lookups.themes
+        assert themes is not None
 
     @pytest.mark.asyncio
-    async def test_lookups_countries(self) -> None:
+    async def test_lookups_countries(self, shared_client: GDELTClient) -> None:
         """Test country codes lookup integration."""
-        async with GDELTClient() as client:
-            countries = client.lookups.countries
-            assert countries is not None
+        countries = shared_client.lookups.countries
+        assert countries is not None
 
 
 class TestGDELTClientIntegration:
     """Integration tests for the full client workflow."""
 
     @pytest.mark.asyncio
-    async def test_multiple_endpoint_access_in_one_session(self) -> None:
+    async def test_multiple_endpoint_access_in_one_session(
+        self, shared_client: GDELTClient
+    ) -> None:
         """Test accessing multiple endpoints in a single session."""
-        async with GDELTClient() as client:
-            # All endpoints should be accessible
-            events = client.events
-            mentions = client.mentions
-            gkg = client.gkg
-            doc = client.doc
-            lookups = client.lookups
-
-            assert isinstance(events, EventsEndpoint)
-            assert isinstance(mentions, MentionsEndpoint)
-            assert isinstance(gkg, GKGEndpoint)
-            assert isinstance(doc, DocEndpoint)
-            assert isinstance(lookups, Lookups)
+        # All endpoints should be accessible
+        events = shared_client.events
+        mentions = shared_client.mentions
+        gkg = shared_client.gkg
+        doc = shared_client.doc
+        lookups = shared_client.lookups
+
+        assert isinstance(events, EventsEndpoint)
+        assert isinstance(mentions, MentionsEndpoint)
+        assert isinstance(gkg, GKGEndpoint)
+        assert isinstance(doc, DocEndpoint)
+        assert isinstance(lookups, Lookups)
 
+    @pytest.mark.parametrize("attr", ["doc", "geo", "context", "tv", "tv_ai"])
     @pytest.mark.asyncio
-    async def test_endpoint_shares_http_client(self) -> None:
-        """Test that REST endpoints share the same HTTP client."""
-        async with GDELTClient() as client:
-            doc = client.doc
-            geo = client.geo
-            context = client.context
-
-            # All should use the same HTTP client instance
-            assert doc._client is geo._client
-            assert geo._client is context._client
-            assert doc._client is client._http_client
-
+    async def test_endpoint_shares_http_client(
+        self,
+        shared_client: GDELTClient,
+        attr: str,
+    ) -> None:
+        """Test that each REST endpoint uses the client's HTTP client."""
+        assert getattr(shared_client, attr)._client is shared_client._http_client
+
+    @pytest.mark.parametrize("attr", ["events", "mentions", "gkg", "ngrams"])
     @pytest.mark.asyncio
-    async def test_file_based_endpoints_share_file_source(self) -> None:
-        """Test that file-based endpoints share the same FileSource."""
-        async with GDELTClient() as client:
-            events = client.events
-            mentions = client.mentions
-            gkg = client.gkg
-
-            # All should use the same FileSource instance
-            assert events._fetcher._file is client._file_source
-            assert mentions._fetcher._file is client._file_source
-            assert gkg._fetcher._file is client._file_source
+    async def test_file_based_endpoints_share_file_source(
+        self,
+        shared_client: GDELTClient,
+        attr: str,
+    ) -> None:
+        """Test that each file-based endpoint uses the client's FileSource."""
+        assert getattr(shared_client, attr)._fetcher._file is shared_client._file_source
 
     @pytest.mark.asyncio
-    async def test_client_with_all_features_enabled(self) -> None:
+    async def test_client_with_all_features_enabled(
+        self,
+        mock_bigquery_source: MagicMock,
+    ) -> None:
         """Test client with BigQuery and all settings configured."""
         settings = GDELTSettings(
             bigquery_project="test-project",
@@ -390,9 +382,9 @@ class TestGDELTClientIntegration:
             validate_codes=True,
         )
 
-        with patch("py_gdelt.client.BigQuerySource"):
-            async with GDELTClient(settings=settings) as client:
-                # All features should be accessible
-                assert client.events is not None
-                assert client.doc is not None
-                assert client.lookups is not None
+        async with GDELTClient(settings=settings) as client:
+            # All features should be accessible
+            assert client.events is not None
+            assert client.doc is not None
+            assert client.lookups is not None
+            assert client._bigquery_source is mock_bigquery_source.return_value
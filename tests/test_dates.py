@@ -16,95 +16,109 @@ from py_gdelt.utils.dates import (
 class TestParseGdeltDatetime:
     """Tests for parse_gdelt_datetime (strict)."""
 
-    def test_gdelt_14_digit_format(self) -> None:
-        result = parse_gdelt_datetime("20240115120000")
-        assert result == datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-
-    def test_gdelt_8_digit_format(self) -> None:
-        result = parse_gdelt_datetime("20240115")
-        assert result == datetime(2024, 1, 15, 0, 0, 0, tzinfo=UTC)
-
-    def test_integer_input(self) -> None:
-        result = parse_gdelt_datetime(20240115120000)
-        assert result == datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-
-    def test_integer_8_digit_input(self) -> None:
-        """8-digit integer should parse as date at midnight UTC."""
-        result = parse_gdelt_datetime(20240115)
-        assert result == datetime(2024, 1, 15, 0, 0, 0, tzinfo=UTC)
-
-    def test_iso_format_with_t(self) -> None:
-        result = parse_gdelt_datetime("2024-01-15T12:00:00")
-        assert result == datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-
-    def test_iso_format_with_z(self) -> None:
-        result = parse_gdelt_datetime("2024-01-15T12:00:00Z")
-        assert result == datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-
-    def test_iso_format_with_offset(self) -> None:
-        # Input is +05:00, should convert to UTC (7:00 AM UTC)
-        result = parse_gdelt_datetime("2024-01-15T12:00:00+05:00")
-        assert result == datetime(2024, 1, 15, 7, 0, 0, tzinfo=UTC)
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(
+                "20240115120000", datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC), id="gdelt_14_digit"
+            ),
+            pytest.param(
+                "20240115", datetime(2024, 1, 15, 0, 0, 0, tzinfo=UTC), id="gdelt_8_digit"
+            ),
+            pytest.param(
+                20240115120000, datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC), id="integer_14_digit"
+            ),
+            # 8-digit integer should parse as date at midnight UTC
+            pytest.param(
+                20240115, datetime(2024, 1, 15, 0, 0, 0, tzinfo=UTC), id="integer_8_digit"
+            ),
+            pytest.param(
+                "2024-01-15T12:00:00", datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC), id="iso_with_t"
+            ),
+            pytest.param(
+                "2024-01-15T12:00:00Z", datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC), id="iso_with_z"
+            ),
+            # Input is +05:00, should convert to UTC (7:00 AM UTC)
+            pytest.param(
+                "2024-01-15T12:00:00+05:00",
+                datetime(2024, 1, 15, 7, 0, 0, tzinfo=UTC),
+                id="iso_with_offset",
+            ),
+            pytest.param(
+                "2024-01-15", datetime(2024, 1, 15, 0, 0, 0, tzinfo=UTC), id="iso_date_only"
+            ),
+        ],
+    )
+    def test_valid_format(self, value: str | int, expected: datetime) -> None:
+        assert parse_gdelt_datetime(value) == expected
 
     def test_iso_format_with_microseconds(self) -> None:
         result = parse_gdelt_datetime("2024-01-15T12:00:00.123456")
         assert result.microsecond == 123456
 
-    def test_iso_date_only(self) -> None:
-        result = parse_gdelt_datetime("2024-01-15")
-        assert result == datetime(2024, 1, 15, 0, 0, 0, tzinfo=UTC)
-
-    def test_datetime_with_utc_passthrough(self) -> None:
-        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-        result = parse_gdelt_datetime(dt)
-        assert result == dt
-        assert result.tzinfo == UTC
-
-    def test_naive_datetime_gets_utc(self) -> None:
-        dt = datetime(2024, 1, 15, 12, 0, 0)
-        result = parse_gdelt_datetime(dt)
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(
+                datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC),
+                datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC),
+                id="utc_datetime_passthrough",
+            ),
+            pytest.param(
+                datetime(2024, 1, 15, 12, 0, 0),
+                datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC),
+                id="naive_datetime_utc_attached",
+            ),
+            # +05:00 offset should be converted to 7:00 AM UTC
+            pytest.param(
+                datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone(timedelta(hours=5))),
+                datetime(2024, 1, 15, 7, 0, 0, tzinfo=UTC),
+                id="aware_datetime_to_utc",
+            ),
+        ],
+    )
+    def test_datetime_input(self, value: datetime, expected: datetime) -> None:
+        result = parse_gdelt_datetime(value)
+        assert result == expected
         assert result.tzinfo == UTC
 
-    def test_aware_datetime_converted_to_utc(self) -> None:
-        # Create datetime with +05:00 offset
-        tz_plus5 = timezone(timedelta(hours=5))
-        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=tz_plus5)
-        result = parse_gdelt_datetime(dt)
-        # Should be converted to 7:00 AM UTC
-        assert result == datetime(2024, 1, 15, 7, 0, 0, tzinfo=UTC)
-
-    def test_invalid_format_raises(self) -> None:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("invalid", id="invalid"),
+            pytest.param("", id="empty_string"),
+            pytest.param("2024011512", id="partial_10_digit"),
+            pytest.param("20241315120000", id="14_digit_month_13"),
+        ],
+    )
+    def test_invalid_format_raises(self, value: str) -> None:
         with pytest.raises(ValueError, match="Invalid GDELT date format"):
-            parse_gdelt_datetime("invalid")
-
-    def test_empty_string_raises(self) -> None:
-        with pytest.raises(ValueError, match="Invalid GDELT date format"):
-            parse_gdelt_datetime("")
-
-    def test_partial_format_raises(self) -> None:
-        with pytest.raises(ValueError, match="Invalid GDELT date format"):
-            parse_gdelt_datetime("2024011512")  # 10 digits
+            parse_gdelt_datetime(value)
 
 
 class TestTryParseGdeltDatetime:
     """Tests for try_parse_gdelt_datetime (lenient)."""
 
-    def test_valid_format_returns_datetime(self) -> None:
-        result = try_parse_gdelt_datetime("20240115120000")
-        assert result == datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-
-    def test_none_returns_none(self) -> None:
-        assert try_parse_gdelt_datetime(None) is None
-
-    def test_invalid_format_returns_none(self) -> None:
-        assert try_parse_gdelt_datetime("invalid") is None
-
-    def test_empty_string_returns_none(self) -> None:
-        assert try_parse_gdelt_datetime("") is None
-
-    def test_integer_input(self) -> None:
-        result = try_parse_gdelt_datetime(20240115120000)
-        assert result == datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("20240115120000", id="gdelt_14_digit"),
+            pytest.param(20240115120000, id="integer_14_digit"),
+        ],
+    )
+    def test_valid_format_returns_datetime(self, value: str | int) -> None:
+        assert try_parse_gdelt_datetime(value) == datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(None, id="none"),
+            pytest.param("invalid", id="invalid"),
+            pytest.param("", id="empty_string"),
+        ],
+    )
+    def test_unparseable_returns_none(self, value: str | None) -> None:
+        assert try_parse_gdelt_datetime(value) is None
 
 
 class TestParseGdeltDate:
@@ -122,15 +136,15 @@ class TestParseGdeltDate:
         dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
         assert parse_gdelt_date(dt) == date(2024, 1, 15)
 
-    def test_invalid_format_raises(self) -> None:
-        with pytest.raises(ValueError, match="Invalid GDELT date format"):
-            parse_gdelt_date("invalid")
-
-    def test_empty_string_raises(self) -> None:
-        with pytest.raises(ValueError, match="Invalid GDELT date format"):
-            parse_gdelt_date("")
-
-    def test_14_digit_string_raises(self) -> None:
-        """14-digit timestamp format should fail for date-only parsing."""
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("invalid", id="invalid"),
+            pytest.param("", id="empty_string"),
+            # 14-digit timestamp format should fail for date-only parsing
+            pytest.param("20240115120000", id="14_digit_timestamp"),
+        ],
+    )
+    def test_invalid_format_raises(self, value: str) -> None:
         with pytest.raises(ValueError, match="Invalid GDELT date format"):
-            parse_gdelt_date("20240115120000")
+            parse_gdelt_date(value)
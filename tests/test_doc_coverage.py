@@ -7,6 +7,7 @@ This test ensures that:
 This prevents documentation drift where new exports are added but not documented.
 """
 
+import re
 from pathlib import Path
 from types import ModuleType
 from typing import Any
@@ -33,20 +34,9 @@ def _get_documented_items(doc_file: Path, module_path: str) -> set[str]:
     Returns:
         Set of class names that are documented in the file.
     """
-    documented: set[str] = set()
-    content = doc_file.read_text()
-    prefix = f"::: {module_path}."
-
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-        # Look for mkdocstrings reference pattern: ::: py_gdelt.models.ClassName
-        if line.startswith(prefix):
-            # Extract the class name using removeprefix for robustness
-            class_name = line.removeprefix(prefix).strip()
-            if class_name:  # Ensure we got a valid name
-                documented.add(class_name)
-
-    return documented
+    # mkdocstrings reference pattern: ::: py_gdelt.models.ClassName
+    pattern = re.compile(rf"^\s*:::\s+{re.escape(module_path)}\.(\S+)\s*$", re.MULTILINE)
+    return set(pattern.findall(doc_file.read_text()))
 
 
 def _get_public_classes(module: ModuleType) -> set[str]:
@@ -60,8 +50,8 @@ def _get_public_classes(module: ModuleType) -> set[str]:
     """
     return {
         name
-        for name in dir(module)
-        if not name.startswith("_") and isinstance(getattr(module, name), type)
+        for name, obj in vars(module).items()
+        if not name.startswith("_") and isinstance(obj, type)
     }
 
 
@@ -76,10 +66,8 @@ def _get_public_exceptions(module: ModuleType) -> set[str]:
     """
     return {
         name
-        for name in dir(module)
-        if not name.startswith("_")
-        and isinstance(getattr(module, name), type)
-        and issubclass(getattr(module, name), Exception)
+        for name, obj in vars(module).items()
+        if not name.startswith("_") and isinstance(obj, type) and issubclass(obj, Exception)
     }
 
 
@@ -112,23 +100,23 @@ def test_all_exports_documented(
     documented = _get_documented_items(doc_file, module_path)
 
     # Find any missing documentation
-    undocumented = exported - documented
-    extra_documented = documented - exported
+    undocumented = sorted(exported - documented)
+    extra_documented = sorted(documented - exported)
 
     # Build helpful error messages
     errors: list[str] = []
     if undocumented:
-        suggestions = "\n".join(f"  ::: {module_path}.{item}" for item in sorted(undocumented))
+        suggestions = "\n".join(f"  ::: {module_path}.{item}" for item in undocumented)
         errors.append(
             f"{module_name.title()} exported but NOT documented in {doc_path}:\n"
-            f"  {sorted(undocumented)}\n"
+            f"  {undocumented}\n"
             f"  Add these to {doc_path} with mkdocstrings syntax:\n"
             f"{suggestions}"
         )
     if extra_documented:
         errors.append(
             f"{module_name.title()} documented but NOT exported from {module_path}:\n"
-            f"  {sorted(extra_documented)}\n"
+            f"  {extra_documented}\n"
             f"  Either add to {module_name}/__init__.py __all__ or remove from docs."
         )
 
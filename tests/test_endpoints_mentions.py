@@ -4,6 +4,7 @@ This module tests the MentionsEndpoint class which provides access to GDELT Ment
 using DataFetcher for source orchestration.
 """
 
+from collections.abc import AsyncIterator, Callable
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
@@ -16,6 +17,60 @@ from py_gdelt.models.common import FetchResult
 from py_gdelt.models.events import Mention
 
 
+# Fields shared by every generated _RawMention; only the per-index fields vary
+_RAW_MENTION_DEFAULTS = {
+    "global_event_id": "123456789",
+    "event_time_date": "20240101",
+    "event_time_full": "20240101120000",
+    "mention_time_date": "20240101",
+    "mention_time_full": "20240101130000",
+    "mention_type": "1",
+    "actor1_char_offset": "0",
+    "actor2_char_offset": "0",
+    "action_char_offset": "0",
+    "in_raw_text": "1",
+    "confidence": "75",
+    "mention_doc_length": "1000",
+    "mention_doc_tone": "0.0",
+    "mention_doc_translation_info": None,
+    "extras": None,
+}
+
+
+def _async_iter(*items: object) -> Callable[..., AsyncIterator[object]]:
+    """Build a fetch_mentions replacement that yields the given items.
+
+    Args:
+        *items: Records to yield, in order.
+
+    Returns:
+        Async generator function accepting any fetcher arguments.
+    """
+
+    async def fetch_mentions(*args: object, **kwargs: object) -> AsyncIterator[object]:
+        for item in items:
+            yield item
+
+    return fetch_mentions
+
+
+def _make_raw_mention(i: int) -> _RawMention:
+    """Build the i-th generated _RawMention for multi-record tests.
+
+    Args:
+        i: Index used for the source name, URL and sentence ID.
+
+    Returns:
+        _RawMention with source "Source {i}".
+    """
+    return _RawMention(
+        **_RAW_MENTION_DEFAULTS,
+        mention_source_name=f"Source {i}",
+        mention_identifier=f"https://example.com/{i}",
+        sentence_id=str(i),
+    )
+
+
 @pytest.fixture
 def mock_file_source() -> MagicMock:
     """Create mock FileSource."""
@@ -34,7 +89,7 @@ def mock_bigquery_source() -> MagicMock:
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_filter() -> EventFilter:
     """Create test EventFilter."""
     return EventFilter(
@@ -42,7 +97,7 @@ def event_filter() -> EventFilter:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_raw_mention() -> _RawMention:
     """Create sample _RawMention for testing."""
     return _RawMention(
@@ -67,7 +122,7 @@ def sample_raw_mention() -> _RawMention:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bigquery_row() -> dict:
     """Create sample BigQuery row dict for testing."""
     return {
@@ -99,7 +154,6 @@ class TestMentionsEndpointInit:
         """Test initialization with only file source."""
         endpoint = MentionsEndpoint(file_source=mock_file_source)
 
-        assert hasattr(endpoint, "_fetcher")
         assert endpoint._fetcher is not None
 
     def test_init_with_both_sources(
@@ -114,7 +168,6 @@ class TestMentionsEndpointInit:
             fallback_enabled=True,
         )
 
-        assert hasattr(endpoint, "_fetcher")
         assert endpoint._fetcher._fallback is True
 
     def test_init_with_fallback_disabled(
@@ -147,22 +200,25 @@ class TestMentionsEndpointInit:
 class TestMentionsEndpointQuery:
     """Test MentionsEndpoint.query() method."""
 
+    @pytest.mark.parametrize(
+        "sample_fixture",
+        ["sample_raw_mention", "sample_bigquery_row"],
+        ids=["raw_mention", "bigquery_dict"],
+    )
     @pytest.mark.asyncio
-    async def test_query_returns_fetch_result(
+    async def test_query_converts_to_mention(
         self,
         mock_file_source: MagicMock,
         event_filter: EventFilter,
-        sample_raw_mention: _RawMention,
+        sample_fixture: str,
+        request: pytest.FixtureRequest,
     ) -> None:
-        """Test that query() returns FetchResult."""
-
-        # Setup mock to return async iterator
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_raw_mention
+        """Test that query() returns a FetchResult of Mentions from files or BigQuery rows."""
+        sample = request.getfixturevalue(sample_fixture)
 
         endpoint = MentionsEndpoint(file_source=mock_file_source)
         # Mock the fetcher's fetch_mentions method
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(sample)
 
         result = await endpoint.query(
             global_event_id="123456789",
@@ -172,28 +228,6 @@ class TestMentionsEndpointQuery:
         assert isinstance(result, FetchResult)
         assert len(result) == 1
         assert result.complete
-
-    @pytest.mark.asyncio
-    async def test_query_converts_raw_to_mention(
-        self,
-        mock_file_source: MagicMock,
-        event_filter: EventFilter,
-        sample_raw_mention: _RawMention,
-    ) -> None:
-        """Test that query() converts _RawMention to Mention."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_raw_mention
-
-        endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
-
-        result = await endpoint.query(
-            global_event_id="123456789",
-            filter_obj=event_filter,
-        )
-
-        assert len(result.data) == 1
         mention = result.data[0]
         assert isinstance(mention, Mention)
         assert mention.global_event_id == 123456789
@@ -208,33 +242,8 @@ class TestMentionsEndpointQuery:
         sample_raw_mention: _RawMention,
     ) -> None:
         """Test query() with multiple mentions."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            for i in range(3):
-                mention = _RawMention(
-                    global_event_id="123456789",
-                    event_time_date="20240101",
-                    event_time_full="20240101120000",
-                    mention_time_date="20240101",
-                    mention_time_full="20240101130000",
-                    mention_type="1",
-                    mention_source_name=f"Source {i}",
-                    mention_identifier=f"https://example.com/{i}",
-                    sentence_id=str(i),
-                    actor1_char_offset="0",
-                    actor2_char_offset="0",
-                    action_char_offset="0",
-                    in_raw_text="1",
-                    confidence="75",
-                    mention_doc_length="1000",
-                    mention_doc_tone="0.0",
-                    mention_doc_translation_info=None,
-                    extras=None,
-                )
-                yield mention
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(*map(_make_raw_mention, range(3)))
         result = await endpoint.query(
             global_event_id="123456789",
             filter_obj=event_filter,
@@ -244,31 +253,6 @@ class TestMentionsEndpointQuery:
         assert all(isinstance(m, Mention) for m in result.data)
         assert [m.source_name for m in result.data] == ["Source 0", "Source 1", "Source 2"]
 
-    @pytest.mark.asyncio
-    async def test_query_with_bigquery_dict(
-        self,
-        mock_file_source: MagicMock,
-        event_filter: EventFilter,
-        sample_bigquery_row: dict,
-    ) -> None:
-        """Test query() handles BigQuery dict results."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_bigquery_row
-
-        endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
-        result = await endpoint.query(
-            global_event_id="123456789",
-            filter_obj=event_filter,
-        )
-
-        assert len(result) == 1
-        mention = result.data[0]
-        assert isinstance(mention, Mention)
-        assert mention.global_event_id == 123456789
-        assert mention.source_name == "BBC News"
-
     @pytest.mark.asyncio
     async def test_query_passes_parameters_to_fetcher(
         self,
@@ -308,12 +292,8 @@ class TestMentionsEndpointStream:
         sample_raw_mention: _RawMention,
     ) -> None:
         """Test that stream() yields Mention objects."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_raw_mention
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(sample_raw_mention)
         mentions = [
             mention
             async for mention in endpoint.stream(
@@ -334,12 +314,8 @@ class TestMentionsEndpointStream:
         sample_raw_mention: _RawMention,
     ) -> None:
         """Test that stream() converts _RawMention to Mention at yield boundary."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_raw_mention
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(sample_raw_mention)
         async for mention in endpoint.stream(
             global_event_id="123456789",
             filter_obj=event_filter,
@@ -357,12 +333,8 @@ class TestMentionsEndpointStream:
         sample_bigquery_row: dict,
     ) -> None:
         """Test that stream() handles BigQuery dict results."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_bigquery_row
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(sample_bigquery_row)
         mentions = [
             mention
             async for mention in endpoint.stream(
@@ -385,27 +357,7 @@ class TestMentionsEndpointStream:
 
         async def mock_fetch_mentions(*args, **kwargs):
             for i in range(100):
-                mention = _RawMention(
-                    global_event_id="123456789",
-                    event_time_date="20240101",
-                    event_time_full="20240101120000",
-                    mention_time_date="20240101",
-                    mention_time_full="20240101130000",
-                    mention_type="1",
-                    mention_source_name=f"Source {i}",
-                    mention_identifier=f"https://example.com/{i}",
-                    sentence_id=str(i),
-                    actor1_char_offset="0",
-                    actor2_char_offset="0",
-                    action_char_offset="0",
-                    in_raw_text="1",
-                    confidence="75",
-                    mention_doc_length="1000",
-                    mention_doc_tone="0.0",
-                    mention_doc_translation_info=None,
-                    extras=None,
-                )
-                yield mention
+                yield _make_raw_mention(i)
 
         endpoint = MentionsEndpoint(file_source=mock_file_source)
         endpoint._fetcher.fetch_mentions = mock_fetch_mentions
@@ -434,12 +386,8 @@ class TestMentionsEndpointSyncWrappers:
         sample_raw_mention: _RawMention,
     ) -> None:
         """Test that query_sync() returns FetchResult."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_raw_mention
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(sample_raw_mention)
         result = endpoint.query_sync(
             global_event_id="123456789",
             filter_obj=event_filter,
@@ -455,33 +403,8 @@ class TestMentionsEndpointSyncWrappers:
         sample_raw_mention: _RawMention,
     ) -> None:
         """Test that stream_sync() yields Mention objects."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            for i in range(3):
-                mention = _RawMention(
-                    global_event_id="123456789",
-                    event_time_date="20240101",
-                    event_time_full="20240101120000",
-                    mention_time_date="20240101",
-                    mention_time_full="20240101130000",
-                    mention_type="1",
-                    mention_source_name=f"Source {i}",
-                    mention_identifier=f"https://example.com/{i}",
-                    sentence_id=str(i),
-                    actor1_char_offset="0",
-                    actor2_char_offset="0",
-                    action_char_offset="0",
-                    in_raw_text="1",
-                    confidence="75",
-                    mention_doc_length="1000",
-                    mention_doc_tone="0.0",
-                    mention_doc_translation_info=None,
-                    extras=None,
-                )
-                yield mention
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(*map(_make_raw_mention, range(3)))
         mentions = list(
             endpoint.stream_sync(
                 global_event_id="123456789",
@@ -580,13 +503,8 @@ class TestMentionsEndpointEdgeCases:
         event_filter: EventFilter,
     ) -> None:
         """Test query() with no mentions returned."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            return
-            yield  # Make it a generator
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter()
         result = await endpoint.query(
             global_event_id="123456789",
             filter_obj=event_filter,
@@ -603,13 +521,8 @@ class TestMentionsEndpointEdgeCases:
         event_filter: EventFilter,
     ) -> None:
         """Test stream() with no mentions returned."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            return
-            yield  # Make it a generator
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter()
         mentions = [
             mention
             async for mention in endpoint.stream(
@@ -628,12 +541,8 @@ class TestMentionsEndpointEdgeCases:
         sample_raw_mention: _RawMention,
     ) -> None:
         """Test query() with use_bigquery=False (files)."""
-
-        async def mock_fetch_mentions(*args, **kwargs):
-            yield sample_raw_mention
-
         endpoint = MentionsEndpoint(file_source=mock_file_source)
-        endpoint._fetcher.fetch_mentions = mock_fetch_mentions
+        endpoint._fetcher.fetch_mentions = _async_iter(sample_raw_mention)
         result = await endpoint.query(
             global_event_id="123456789",
             filter_obj=event_filter,
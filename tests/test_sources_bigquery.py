@@ -7,6 +7,7 @@ This module tests the BigQuery data source with a focus on:
 - Async execution: run_in_executor usage, streaming results
 """
 
+import asyncio
 import re
 from datetime import date
 from pathlib import Path
@@ -18,7 +19,12 @@ from google.cloud import bigquery
 from google.cloud.exceptions import GoogleCloudError
 
 from py_gdelt.config import GDELTSettings
-from py_gdelt.exceptions import BigQueryError, ConfigurationError, SecurityError
+from py_gdelt.exceptions import (
+    BigQueryError,
+    ConfigurationError,
+    InvalidCodeError,
+    SecurityError,
+)
 from py_gdelt.filters import DateRange, EventFilter, GKGFilter
 from py_gdelt.sources.bigquery import (
     BigQuerySource,
@@ -561,8 +567,6 @@ class TestSecurityFeatures:
         assert actor1_param.value == "US"  # Stored safely as parameter (normalized to FIPS)
 
         # Test that invalid country codes are caught by Pydantic validation
-        from py_gdelt.exceptions import InvalidCodeError
-
         with pytest.raises(InvalidCodeError):
             EventFilter(
                 date_range=DateRange(start=date(2024, 1, 1)),
@@ -617,8 +621,6 @@ class TestSecurityFeatures:
                 nonlocal results
                 results.extend([row async for row in source.query_events(filter_obj)])
 
-            import asyncio
-
             asyncio.run(collect())
         except BigQueryError as e:
             error_msg = str(e)
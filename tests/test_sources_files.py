@@ -498,6 +498,57 @@ class TestDownloadAndExtract:
             with pytest.raises(DataError, match="Invalid archive format"):
                 await file_source.download_and_extract(url)
 
+    @pytest.mark.asyncio
+    async def test_download_and_extract_multi_member_gzip(
+        self,
+        file_source: FileSource,
+    ) -> None:
+        """Test extraction of concatenated GZIP members."""
+        url = "http://data.gdeltproject.org/gdeltv3/webngrams/20240101000000.webngrams.json.gz"
+        gzip_data = gzip.compress(b"first\n") + gzip.compress(b"second\n")
+
+        async with respx.mock:
+            respx.get(url).mock(
+                return_value=httpx.Response(200, content=gzip_data),
+            )
+
+            data = await file_source.download_and_extract(url)
+
+            assert data == b"first\nsecond\n"
+
+    @pytest.mark.asyncio
+    async def test_download_and_extract_bad_gzip(
+        self,
+        file_source: FileSource,
+    ) -> None:
+        """Test extraction of invalid GZIP file."""
+        url = "http://data.gdeltproject.org/gdeltv3/webngrams/20240101000000.webngrams.json.gz"
+
+        async with respx.mock:
+            respx.get(url).mock(
+                return_value=httpx.Response(200, content=b"not a valid gzip file"),
+            )
+
+            with pytest.raises(DataError, match="Invalid archive format"):
+                await file_source.download_and_extract(url)
+
+    @pytest.mark.asyncio
+    async def test_download_and_extract_truncated_gzip(
+        self,
+        file_source: FileSource,
+    ) -> None:
+        """Test extraction of GZIP file cut off before its end marker."""
+        url = "http://data.gdeltproject.org/gdeltv3/webngrams/20240101000000.webngrams.json.gz"
+        gzip_data = gzip.compress(b"some data" * 100)
+
+        async with respx.mock:
+            respx.get(url).mock(
+                return_value=httpx.Response(200, content=gzip_data[:-10]),
+            )
+
+            with pytest.raises(DataError, match="end-of-stream marker"):
+                await file_source.download_and_extract(url)
+
     @pytest.mark.asyncio
     async def test_download_and_extract_gzip_bomb(
         self,
@@ -10,6 +10,8 @@ Tests cover:
 
 from __future__ import annotations
 
+import math
+import sys
 from typing import Any
 
 import httpx
@@ -17,7 +19,7 @@ import pytest
 import respx
 
 from py_gdelt.config import GDELTSettings
-from py_gdelt.endpoints.base import BaseEndpoint
+from py_gdelt.endpoints.base import BaseEndpoint, _select_json_loads
 from py_gdelt.exceptions import APIError, APIUnavailableError, RateLimitError
 
 
@@ -287,15 +289,85 @@ class TestJSONHelper:
 
     @respx.mock
     async def test_get_json_raises_on_invalid_json(self) -> None:
-        """Test _get_json raises on invalid JSON response."""
+        """Test _get_json raises APIError on invalid JSON response."""
         respx.get("https://api.gdeltproject.org/test").mock(
             return_value=httpx.Response(200, text="not json"),
         )
 
         async with TestEndpoint() as endpoint:
-            with pytest.raises(Exception):  # httpx raises JSONDecodeError
+            with pytest.raises(APIError, match="Invalid JSON"):
                 await endpoint._get_json("https://api.gdeltproject.org/test")
 
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param(b'{"a": 1}', {"a": 1}, id="plain"),
+            pytest.param(b'\xef\xbb\xbf{"a": 1}', {"a": 1}, id="utf8_bom"),
+            pytest.param('{"a": 1}'.encode("utf-16"), {"a": 1}, id="utf16"),
+            pytest.param(b'{"title": "\\ud83d x"}', {"title": "\ud83d x"}, id="lone_surrogate"),
+        ],
+    )
+    @respx.mock
+    async def test_get_json_with_orjson_matches_stdlib(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        content: bytes,
+        expected: Any,
+    ) -> None:
+        """Test bodies orjson rejects still decode like the stdlib."""
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr("py_gdelt.endpoints.base._json_loads", orjson.loads)
+        respx.get("https://api.gdeltproject.org/test").mock(
+            return_value=httpx.Response(200, content=content),
+        )
+
+        async with TestEndpoint() as endpoint:
+            data = await endpoint._get_json("https://api.gdeltproject.org/test")
+
+        assert data == expected
+
+    @respx.mock
+    async def test_get_json_with_orjson_accepts_nan(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test NaN, which orjson rejects, decodes like the stdlib."""
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr("py_gdelt.endpoints.base._json_loads", orjson.loads)
+        respx.get("https://api.gdeltproject.org/test").mock(
+            return_value=httpx.Response(200, content=b'{"tone": NaN}'),
+        )
+
+        async with TestEndpoint() as endpoint:
+            data = await endpoint._get_json("https://api.gdeltproject.org/test")
+
+        assert math.isnan(data["tone"])
+
+    @respx.mock
+    async def test_get_json_with_orjson_raises_on_invalid_json(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test invalid JSON raises APIError on the orjson path too."""
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr("py_gdelt.endpoints.base._json_loads", orjson.loads)
+        respx.get("https://api.gdeltproject.org/test").mock(
+            return_value=httpx.Response(200, text="not json"),
+        )
+
+        async with TestEndpoint() as endpoint:
+            with pytest.raises(APIError, match="Invalid JSON"):
+                await endpoint._get_json("https://api.gdeltproject.org/test")
+
+    def test_select_json_loads_without_orjson(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test no fast decoder is selected when orjson is not installed."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        assert _select_json_loads() is None
+
 
 class TestRetryBehavior:
     """Test retry logic for transient errors."""
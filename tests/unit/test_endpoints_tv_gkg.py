@@ -293,6 +293,74 @@ class TestTVGKGEndpointStreaming:
         # Should filter out CNN record
         assert len(records) == 0
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("themes", "expected_count"),
+        [
+            (["ENV_CLIMATECHANGE"], 1),
+            (["env_climatechange"], 1),  # Case-insensitive
+            (["TAX_FNCACT", "WB_635_ECONOMIC_ACTIVITY"], 1),  # Any theme matches
+            (["TAX_FNCACT"], 0),
+        ],
+    )
+    async def test_stream_with_theme_filter(
+        self,
+        mock_file_source: MagicMock,
+        sample_raw_gkg: _RawGKG,
+        themes: list[str],
+        expected_count: int,
+    ) -> None:
+        """Test streaming with theme filtering."""
+        endpoint = TVGKGEndpoint(file_source=mock_file_source)
+
+        filter_obj = TVGKGFilter(
+            date_range=DateRange(start=date(2024, 1, 1)),
+            themes=themes,
+        )
+
+        # Mock stream_files
+        async def mock_stream_files(urls: list[str]) -> AsyncIterator[tuple[str, bytes]]:
+            line = "\t".join(
+                [
+                    sample_raw_gkg.gkg_record_id,
+                    sample_raw_gkg.date,
+                    sample_raw_gkg.source_collection_id,
+                    sample_raw_gkg.source_common_name,
+                    sample_raw_gkg.document_identifier,
+                    sample_raw_gkg.counts_v1,
+                    sample_raw_gkg.counts_v2,
+                    sample_raw_gkg.themes_v1,
+                    sample_raw_gkg.themes_v2_enhanced,
+                    sample_raw_gkg.locations_v1,
+                    sample_raw_gkg.locations_v2_enhanced,
+                    sample_raw_gkg.persons_v1,
+                    sample_raw_gkg.persons_v2_enhanced,
+                    sample_raw_gkg.organizations_v1,
+                    sample_raw_gkg.organizations_v2_enhanced,
+                    sample_raw_gkg.tone,
+                    sample_raw_gkg.dates_v2,
+                    sample_raw_gkg.gcam,
+                    sample_raw_gkg.sharing_image or "",
+                    sample_raw_gkg.related_images or "",
+                    sample_raw_gkg.social_image_embeds or "",
+                    sample_raw_gkg.social_video_embeds or "",
+                    sample_raw_gkg.quotations or "",
+                    sample_raw_gkg.all_names or "",
+                    sample_raw_gkg.amounts or "",
+                    sample_raw_gkg.translation_info or "",
+                    sample_raw_gkg.extras_xml or "",
+                ]
+            )
+            yield ("http://test.url", line.encode("utf-8"))
+
+        mock_file_source.stream_files = mock_stream_files
+
+        # Suppress embargo warning
+        with patch("warnings.warn"):
+            records = [record async for record in endpoint.stream(filter_obj)]
+
+        assert len(records) == expected_count
+
 
 class TestTVGKGEndpointQuery:
     """Test query() functionality."""